@@ -3,32 +3,147 @@ GAME Worker for Allora Network price prediction - Virtual/USDT only
 """
 import os
 import sys
+import atexit
 import asyncio
 import hashlib
-from typing import Dict, Tuple
+import logging
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, Tuple
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import aiohttp
+import numpy as np
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Add parent directory to path for imports when run as a script
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from allora_sdk import AlloraAPIClient
 from allora_sdk.api_client import ChainID, SignatureFormat
 from game_sdk.game.worker import Worker
 from game_sdk.game.custom_types import Function, FunctionResultStatus
-from src.cities import INVISIBLE_CITIES
+from src.cities import INVISIBLE_CITIES, City
 
-# Initialize Allora client
-allora_client = AlloraAPIClient(
-    chain_id=ChainID.TESTNET,
-    api_key=os.getenv("ALLORA_API_KEY", "UP-220d05d2c2cd4685ae1ef6b8")
-)
+logger = logging.getLogger(__name__)
 
 # Virtual/USDT topic ID on Allora Network
 VIRTUAL_TOPIC_ID = 31
 
-# Cache for Virtual price (refresh every minute)
+# Timeout (seconds) for Allora calls made from the synchronous GAME worker
+ALLORA_TIMEOUT = 5
+
+# Persistent event loop for Allora calls from synchronous code, so the client
+# keeps its connections between calls instead of spinning up a loop each time
+_allora_loop = asyncio.new_event_loop()
+threading.Thread(target=_allora_loop.run_forever, name="allora-loop", daemon=True).start()
+
+# Shared Allora client, created on first use
+_allora_client = None
+
+
+class KeepAliveFetcher:
+    """Allora fetcher that reuses one keep-alive HTTP session across requests"""
+
+    def __init__(self):
+        self._session = None
+
+    async def fetch(self, url: str, headers: dict):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+        async with self._session.get(url, headers=headers) as response:
+            response.raise_for_status()
+            # Parse the raw body directly, skipping aiohttp's text decode
+            return json_loads(await response.read())
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+def get_allora_client() -> AlloraAPIClient:
+    """Get the shared Allora client (its session lives on the Allora loop)"""
+    global _allora_client
+    if _allora_client is None:
+        _allora_client = AlloraAPIClient(
+            chain_id=ChainID.TESTNET,
+            api_key=os.getenv("ALLORA_API_KEY", "UP-220d05d2c2cd4685ae1ef6b8"),
+            fetcher=KeepAliveFetcher()
+        )
+    return _allora_client
+
+
+@atexit.register
+def _close_allora_client():
+    """Close the shared HTTP session before the interpreter exits"""
+    if _allora_client is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(
+                _allora_client.fetcher.close(), _allora_loop
+            ).result(timeout=ALLORA_TIMEOUT)
+        except Exception:
+            pass
+
+
+# Cache for Virtual price (stale-while-revalidate)
+# Younger than the soft TTL: served as is. Between soft and hard TTL: served
+# while a background refresh runs. Older than the hard TTL: callers wait.
+PRICE_SOFT_TTL = 45
+PRICE_HARD_TTL = 300
 _virtual_price_cache = None
 _cache_timestamp = None
 
+# Refresh currently in flight; concurrent callers share it instead of
+# each issuing their own Allora request
+_inflight_refresh = None
+_inflight_lock = threading.Lock()
+
+
+async def _fetch_and_store_price() -> float:
+    """Fetch the Virtual/USDT inference and update the cache (runs on the Allora loop)"""
+    global _virtual_price_cache, _cache_timestamp
+
+    inference = await get_allora_client().get_inference_by_topic_id(
+        topic_id=VIRTUAL_TOPIC_ID,
+        signature_format=SignatureFormat.ETHEREUM_SEPOLIA
+    )
+    price = float(inference.inference_data.network_inference_normalized)
+
+    _virtual_price_cache = price
+    _cache_timestamp = time.time()
+    return price
+
+
+def _refresh_virtual_price():
+    """Start a price refresh on the Allora loop, or join the one already in flight"""
+    global _inflight_refresh
+    with _inflight_lock:
+        if _inflight_refresh is None or _inflight_refresh.done():
+            _inflight_refresh = asyncio.run_coroutine_threadsafe(_fetch_and_store_price(), _allora_loop)
+        return _inflight_refresh
+
+
+# Price buckets shared by the GAME worker and trading decisions: a price
+# strictly above _BUCKETS[i - 1] and at most _BUCKETS[i] falls in bucket i
+_BUCKETS = (10, 15, 20, 25)
+_SENTIMENTS = ("VERY_BEARISH", "BEARISH", "NEUTRAL", "BULLISH", "VERY_BULLISH")
+_STRENGTHS = ("Very Weak", "Weak", "Neutral", "Strong", "Very Strong")
+
+
+def classify_price(price: float) -> Tuple[str, str]:
+    """Get the (sentiment, market strength) labels for a Virtual price"""
+    i = bisect_left(_BUCKETS, price)
+    return _SENTIMENTS[i], _STRENGTHS[i]
+
+
 def create_allora_worker(api_key: str = None) -> Worker:
     """
     Create a GAME Worker that fetches Virtual/USDT price from Allora Network
@@ -45,29 +160,10 @@ def create_allora_worker(api_key: str = None) -> Worker:
     def get_virtual_price_impl(**kwargs) -> Tuple[FunctionResultStatus, str, Dict]:
         """Fetch Virtual/USDT 8h price prediction from Allora Network"""
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-
-            inference = loop.run_until_complete(
-                allora_client.get_inference_by_topic_id(
-                    topic_id=VIRTUAL_TOPIC_ID,
-                    signature_format=SignatureFormat.ETHEREUM_SEPOLIA
-                )
-            )
-
-            price = float(inference.inference_data.network_inference_normalized)
+            price = _refresh_virtual_price().result(timeout=ALLORA_TIMEOUT)
 
             # Determine sentiment based on price
-            if price > 25:
-                sentiment = "VERY_BULLISH"
-            elif price > 20:
-                sentiment = "BULLISH"
-            elif price > 15:
-                sentiment = "NEUTRAL"
-            elif price > 10:
-                sentiment = "BEARISH"
-            else:
-                sentiment = "VERY_BEARISH"
+            sentiment, _ = classify_price(price)
 
             message = f"Virtual/USDT 8h prediction: ${price:.2f} ({sentiment})"
 
@@ -110,53 +206,114 @@ def create_allora_worker(api_key: str = None) -> Worker:
 
 async def get_virtual_price() -> float:
     """
-    Get Virtual/USDT price prediction (with caching)
+    Get Virtual/USDT price prediction (with stale-while-revalidate caching)
 
     Returns:
         Virtual price in USDT
     """
-    global _virtual_price_cache, _cache_timestamp
-
-    import time
-    current_time = time.time()
-
-    # Use cache if available and fresh (< 60 seconds old)
     if _virtual_price_cache is not None and _cache_timestamp is not None:
-        if current_time - _cache_timestamp < 60:
+        age = time.time() - _cache_timestamp
+        if age < PRICE_SOFT_TTL:
+            return _virtual_price_cache
+        if age < PRICE_HARD_TTL:
+            # Serve the cached price while a refresh runs on the Allora loop
+            _refresh_virtual_price()
             return _virtual_price_cache
 
     try:
-        inference = await allora_client.get_inference_by_topic_id(
-            topic_id=VIRTUAL_TOPIC_ID,
-            signature_format=SignatureFormat.ETHEREUM_SEPOLIA
-        )
-        price = float(inference.inference_data.network_inference_normalized)
-
-        # Update cache
-        _virtual_price_cache = price
-        _cache_timestamp = current_time
-
-        return price
+        # Fetch runs on the Allora loop, which owns the shared session
+        return await asyncio.wrap_future(_refresh_virtual_price())
     except Exception as e:
         print(f"Error fetching Virtual price: {e}")
         # Return cached value if available, else default to $20
         return _virtual_price_cache if _virtual_price_cache is not None else 20.0
 
 
-def get_trader_personality(address: str) -> Dict:
+@lru_cache(maxsize=4096)
+def get_personality_index(address: str) -> int:
+    """Get deterministic index into INVISIBLE_CITIES based on wallet address"""
+    digest = hashlib.blake2b(address.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') % len(INVISIBLE_CITIES)
+
+
+@lru_cache(maxsize=4096)
+def get_trader_personality(address: str) -> City:
     """Get deterministic Invisible City personality based on wallet address"""
-    hash_int = int(hashlib.md5(address.encode()).hexdigest(), 16)
-    personality_index = hash_int % len(INVISIBLE_CITIES)
-    return INVISIBLE_CITIES[personality_index]
+    return INVISIBLE_CITIES[get_personality_index(address)]
+
+
+# Personality interpretation handlers, keyed by action_bias.
+# Each takes (virtual_price, sentiment_score, is_bullish, confidence_score, personality)
+# and returns (is_bullish, action, confidence_score).
+
+def _bias_contrarian(virtual_price, sentiment_score, is_bullish, confidence_score, personality):
+    # Euphemia: Do opposite of market
+    is_bullish = not is_bullish
+    return is_bullish, "sell" if is_bullish else "buy", confidence_score
+
+
+def _bias_momentum(virtual_price, sentiment_score, is_bullish, confidence_score, personality):
+    # Chloe: Amplify strong moves
+    if abs(sentiment_score) > 0.2:  # Strong move
+        confidence_score = min(1.0, confidence_score * 1.5)
+    return is_bullish, "buy" if is_bullish else "sell", confidence_score
+
+
+def _bias_cyclical(virtual_price, sentiment_score, is_bullish, confidence_score, personality):
+    # Eutropia: Mean reversion - buy dips, sell rips
+    if virtual_price < 15:  # Deep dip
+        return True, "buy", confidence_score
+    if virtual_price > 25:  # Overbought
+        return False, "sell", confidence_score
+    return is_bullish, "buy" if is_bullish else "sell", confidence_score
+
 
+def _bias_network(virtual_price, sentiment_score, is_bullish, confidence_score, personality):
+    # Ersilia: Wait for confirmation, slightly cautious
+    if confidence_score < personality.confidence_weight:
+        # Uncertain, default to sell
+        return False, "sell", confidence_score
+    return is_bullish, "buy" if is_bullish else "sell", confidence_score
 
-def interpret_virtual_price(virtual_price: float, personality: Dict) -> Tuple[bool, str, float]:
+
+def _bias_hedging(virtual_price, sentiment_score, is_bullish, confidence_score, personality):
+    # Esmeralda: Both sides - but pick one for this trade
+    # Alternates based on price position
+    if virtual_price % 2 < 1:  # Simple alternation logic
+        return is_bullish, "buy" if is_bullish else "sell", confidence_score
+    return is_bullish, "sell" if is_bullish else "buy", confidence_score
+
+
+def _bias_default(virtual_price, sentiment_score, is_bullish, confidence_score, personality):
+    # Default balanced approach
+    return is_bullish, "buy" if is_bullish else "sell", confidence_score
+
+
+_BIAS_HANDLERS: Dict[str, Callable] = {
+    "contrarian": _bias_contrarian,
+    "momentum": _bias_momentum,
+    "cyclical": _bias_cyclical,
+    "network": _bias_network,
+    "hedging": _bias_hedging,
+}
+
+# Per-city strategy commentary logged by get_trading_decision
+_CITY_COMMENTARY: Dict[str, Callable[[float, bool], str]] = {
+    "Euphemia": lambda price, bullish: f"Contrarian: {'Selling into strength' if bullish else 'Buying the dip'}",
+    "Chloe": lambda price, bullish: f"Momentum: {'Riding the trend up' if bullish else 'Following breakdown'}",
+    "Eutropia": lambda price, bullish: f"Cyclical: {'Waiting for cycle turn' if abs(price - 20) < 5 else 'Trading the cycle'}",
+    "Ersilia": lambda price, bullish: f"Network: {'Following smart money' if bullish else 'Network signals bearish'}",
+    "Esmeralda": lambda price, bullish: f"Hedging: {'Opening long position' if bullish else 'Opening short position'}",
+}
+
+
+def interpret_virtual_price(virtual_price: float, personality: City) -> Tuple[bool, str, float]:
     """
     Interpret Virtual/USDT price based on Invisible City personality
 
     Args:
         virtual_price: Virtual token price in USDT
-        personality: Invisible City personality dict
+        personality: Invisible City personality
 
     Returns:
         Tuple of (is_bullish, action, confidence_score)
@@ -171,52 +328,13 @@ def interpret_virtual_price(virtual_price: float, personality: Dict) -> Tuple[bo
         confidence_score = min(1.0, abs(sentiment_score) * 2 + 0.3)
 
         # Base bullish/bearish decision
-        is_bullish = sentiment_score > personality["bullish_threshold"]
+        is_bullish = sentiment_score > personality.bullish_threshold
 
         # Apply personality-specific interpretation
-        action_bias = personality["action_bias"]
-
-        if action_bias == "contrarian":
-            # Euphemia: Do opposite of market
-            is_bullish = not is_bullish
-            action = "sell" if is_bullish else "buy"
-
-        elif action_bias == "momentum":
-            # Chloe: Amplify strong moves
-            if abs(sentiment_score) > 0.2:  # Strong move
-                confidence_score = min(1.0, confidence_score * 1.5)
-            action = "buy" if is_bullish else "sell"
-
-        elif action_bias == "cyclical":
-            # Eutropia: Mean reversion - buy dips, sell rips
-            if virtual_price < 15:  # Deep dip
-                is_bullish = True
-                action = "buy"
-            elif virtual_price > 25:  # Overbought
-                is_bullish = False
-                action = "sell"
-            else:
-                action = "buy" if is_bullish else "sell"
-
-        elif action_bias == "network":
-            # Ersilia: Wait for confirmation, slightly cautious
-            if confidence_score < personality["confidence_weight"]:
-                # Uncertain, default to sell
-                is_bullish = False
-                action = "sell"
-            else:
-                action = "buy" if is_bullish else "sell"
-
-        elif action_bias == "hedging":
-            # Esmeralda: Both sides - but pick one for this trade
-            # Alternates based on price position
-            if virtual_price % 2 < 1:  # Simple alternation logic
-                action = "buy" if is_bullish else "sell"
-            else:
-                action = "sell" if is_bullish else "buy"
-        else:
-            # Default balanced approach
-            action = "buy" if is_bullish else "sell"
+        handler = _BIAS_HANDLERS.get(personality.action_bias, _bias_default)
+        is_bullish, action, confidence_score = handler(
+            virtual_price, sentiment_score, is_bullish, confidence_score, personality
+        )
 
         return is_bullish, action, confidence_score
 
@@ -226,6 +344,83 @@ def interpret_virtual_price(virtual_price: float, personality: Dict) -> Tuple[bo
         return False, "sell", 0.3
 
 
+# Personality fields as parallel arrays for interpret_virtual_price_batch
+_BIAS_CODES = {"contrarian": 0, "momentum": 1, "cyclical": 2, "network": 3, "hedging": 4}
+_THRESHOLDS = np.array([c.bullish_threshold for c in INVISIBLE_CITIES])
+_CONF_WEIGHTS = np.array([c.confidence_weight for c in INVISIBLE_CITIES])
+_BIAS_IDX = np.array([_BIAS_CODES.get(c.action_bias, -1) for c in INVISIBLE_CITIES], dtype=np.int8)
+
+
+def interpret_virtual_price_batch(virtual_price: float, personality_indices) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized interpret_virtual_price for many traders at the same price
+
+    Args:
+        virtual_price: Virtual token price in USDT
+        personality_indices: Indices into INVISIBLE_CITIES, one per trader
+            (see get_personality_index)
+
+    Returns:
+        Tuple of (is_bullish, is_buy, confidence_score) arrays
+    """
+    idx = np.asarray(personality_indices, dtype=np.intp)
+    bias = _BIAS_IDX[idx]
+
+    sentiment_score = (virtual_price - 20) / 20
+    base_confidence = min(1.0, abs(sentiment_score) * 2 + 0.3)
+
+    is_bullish = sentiment_score > _THRESHOLDS[idx]
+    is_buy = is_bullish.copy()
+    confidence_score = np.full(idx.shape, base_confidence)
+
+    # Contrarian: flip the view but keep trading the original direction
+    mask = bias == 0
+    is_bullish[mask] = ~is_bullish[mask]
+
+    # Momentum: amplify strong moves
+    if abs(sentiment_score) > 0.2:
+        confidence_score[bias == 1] = min(1.0, base_confidence * 1.5)
+
+    # Cyclical: buy deep dips, sell overbought
+    if virtual_price < 15 or virtual_price > 25:
+        mask = bias == 2
+        is_bullish[mask] = virtual_price < 15
+        is_buy[mask] = virtual_price < 15
+
+    # Network: sell when confidence is below the personality's weight
+    mask = (bias == 3) & (base_confidence < _CONF_WEIGHTS[idx])
+    is_bullish[mask] = False
+    is_buy[mask] = False
+
+    # Hedging: trade against the view on odd price positions
+    if virtual_price % 2 >= 1:
+        mask = bias == 4
+        is_buy[mask] = ~is_bullish[mask]
+
+    return is_bullish, is_buy, confidence_score
+
+
+# Interpretations for the last seen price, keyed by personality name; the
+# price only moves when Allora publishes a new inference
+_interpretation_memo: Dict[str, Tuple[bool, str, float]] = {}
+_interpretation_memo_price = None
+_interpretation_memo_lock = threading.Lock()
+
+
+def _interpret_memoized(virtual_price: float, personality: City) -> Tuple[bool, str, float]:
+    """interpret_virtual_price, reused until the price changes"""
+    global _interpretation_memo_price
+    with _interpretation_memo_lock:
+        if virtual_price != _interpretation_memo_price:
+            _interpretation_memo.clear()
+            _interpretation_memo_price = virtual_price
+        result = _interpretation_memo.get(personality.name)
+        if result is None:
+            result = interpret_virtual_price(virtual_price, personality)
+            _interpretation_memo[personality.name] = result
+        return result
+
+
 async def get_trading_decision(address: str, proposal_data: Dict = None) -> Tuple[bool, str]:
     """
     Make a trading decision based on Virtual price and Invisible City personality
@@ -242,63 +437,52 @@ async def get_trading_decision(address: str, proposal_data: Dict = None) -> Tupl
     # Get Virtual/USDT 8-hour price prediction
     virtual_price = await get_virtual_price()
 
-    is_bullish, action, confidence = interpret_virtual_price(virtual_price, personality)
+    is_bullish, action, confidence = _interpret_memoized(virtual_price, personality)
 
     # Determine market strength
-    if virtual_price > 25:
-        market_strength = "Very Strong"
-    elif virtual_price > 20:
-        market_strength = "Strong"
-    elif virtual_price > 15:
-        market_strength = "Neutral"
-    elif virtual_price > 10:
-        market_strength = "Weak"
-    else:
-        market_strength = "Very Weak"
+    _, market_strength = classify_price(virtual_price)
 
     # Extract proposal name
     proposal_name = "AI Agent"
     if proposal_data and 'name' in proposal_data:
         proposal_name = proposal_data['name']
 
-    # Log personality-specific trading strategy
-    print(f"\n  {personality['name']} ({personality['theme']}):")
-    print(f"    Proposal: {proposal_name}")
-    print(f"    Virtual Price: ${virtual_price:.2f} ({market_strength})")
-    print(f"    Philosophy: {personality['trading_philosophy']}")
-
-    # Personality-specific interpretation
-    city_name = personality['name']
-
-    if city_name == "Euphemia":
-        print(f"    → Contrarian: {'Selling into strength' if is_bullish else 'Buying the dip'}")
-    elif city_name == "Chloe":
-        print(f"    → Momentum: {'Riding the trend up' if is_bullish else 'Following breakdown'}")
-    elif city_name == "Eutropia":
-        print(f"    → Cyclical: {'Waiting for cycle turn' if abs(virtual_price - 20) < 5 else 'Trading the cycle'}")
-    elif city_name == "Ersilia":
-        print(f"    → Network: {'Following smart money' if is_bullish else 'Network signals bearish'}")
-    elif city_name == "Esmeralda":
-        print(f"    → Hedging: {'Opening long position' if is_bullish else 'Opening short position'}")
-
-    # Trading action on YES/NO tokens
-    if is_bullish:
-        if action == 'buy':
-            print(f"    Decision: BUY YES tokens (bullish on {proposal_name})")
-        else:
-            print(f"    Decision: SELL NO tokens (doesn't believe it will fail)")
-    else:
-        if action == 'buy':
-            print(f"    Decision: BUY NO tokens (bearish on {proposal_name})")
+    # Log personality-specific trading strategy as one record
+    if logger.isEnabledFor(logging.INFO):
+        lines = [
+            f"\n  {personality.name} ({personality.theme}):",
+            f"    Proposal: {proposal_name}",
+            f"    Virtual Price: ${virtual_price:.2f} ({market_strength})",
+            f"    Philosophy: {personality.trading_philosophy}",
+        ]
+
+        # Personality-specific interpretation
+        commentary = _CITY_COMMENTARY.get(personality.name)
+        if commentary:
+            lines.append(f"    → {commentary(virtual_price, is_bullish)}")
+
+        # Trading action on YES/NO tokens
+        if is_bullish:
+            if action == 'buy':
+                lines.append(f"    Decision: BUY YES tokens (bullish on {proposal_name})")
+            else:
+                lines.append(f"    Decision: SELL NO tokens (doesn't believe it will fail)")
         else:
-            print(f"    Decision: SELL YES tokens (skeptical of success)")
-    print(f"    Confidence: {confidence:.0%}")
+            if action == 'buy':
+                lines.append(f"    Decision: BUY NO tokens (bearish on {proposal_name})")
+            else:
+                lines.append(f"    Decision: SELL YES tokens (skeptical of success)")
+        lines.append(f"    Confidence: {confidence:.0%}")
+
+        logger.info("\n".join(lines))
 
     return is_bullish, action
 
 
 # Test function
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     async def test_virtual_price():
         print("Testing Virtual/USDT Price Prediction from Allora Network")
         print("="*60)
@@ -306,30 +490,12 @@ if __name__ == "__main__":
         price = await get_virtual_price()
         print(f"Virtual/USDT 8h Prediction: ${price:.2f}")
 
-        if price > 25:
-            print("Market Sentiment: VERY BULLISH")
-        elif price > 20:
-            print("Market Sentiment: BULLISH")
-        elif price > 15:
-            print("Market Sentiment: NEUTRAL")
-        elif price > 10:
-            print("Market Sentiment: BEARISH")
-        else:
-            print("Market Sentiment: VERY BEARISH")
+        sentiment, _ = classify_price(price)
+        print(f"Market Sentiment: {sentiment.replace('_', ' ')}")
 
         return price
 
-    # Run async test
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        virtual_price = loop.run_until_complete(test_virtual_price())
-    finally:
-        loop.close()
-
     # Test trading decisions for different addresses (map to 5 cities)
-    print("\nTesting Invisible Cities Trading Decisions:")
-    print("="*60)
     test_addresses = [
         "0x1111111111111111111111111111111111111111",  # Euphemia
         "0x2222222222222222222222222222222222222222",  # Chloe
@@ -339,15 +505,17 @@ if __name__ == "__main__":
     ]
 
     async def test_trading():
+        print("\nTesting Invisible Cities Trading Decisions:")
+        print("="*60)
         for addr in test_addresses:
             print(f"\nTesting address: {addr[:8]}...")
             personality = get_trader_personality(addr)
             is_bullish, action = await get_trading_decision(addr)
-            print(f"  Final: {personality['name']} -> {action.upper()}")
+            print(f"  Final: {personality.name} -> {action.upper()}")
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(test_trading())
-    finally:
-        loop.close()
\ No newline at end of file
+    async def _main():
+        await test_virtual_price()
+        await test_trading()
+
+    # Run both tests in one pass on the shared Allora loop
+    asyncio.run_coroutine_threadsafe(_main(), _allora_loop).result()
\ No newline at end of file
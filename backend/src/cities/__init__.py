@@ -1,3 +1,3 @@
-from .invisible_cities import INVISIBLE_CITIES, get_city_by_name, get_city_names
+from .invisible_cities import City, INVISIBLE_CITIES, get_city_by_name, get_city_names
 
-__all__ = ['INVISIBLE_CITIES', 'get_city_by_name', 'get_city_names']
+__all__ = ['City', 'INVISIBLE_CITIES', 'get_city_by_name', 'get_city_names']
@@ -3,8 +3,12 @@
 
 import os
 import asyncio
-import random
-from web3 import Web3
+import logging
+import hashlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from web3 import AsyncWeb3, WebSocketProvider
 from eth_account import Account
 from dotenv import load_dotenv
 import sys
@@ -12,14 +16,17 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.trading_agent.trader_agent import TraderAgent
 from src.proposal_agent.proposal_agent import ProposalAgent
-from src.allora_game_agent.allora_game_agent import get_trader_personality
-from src.launchpad_agent.launchpad_agent import AgentTokenLauncher
+from src.allora_game_agent.allora_game_agent import get_personality_index
+from src.cities import INVISIBLE_CITIES
+from src.launchpad_agent.launchpad_agent import DEFAULT_RPC_URL, AgentTokenLauncher, get_shared_web3, get_ws_rpc_url
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
-RPC_URL = os.getenv("RPC_URL", "https://sepolia.base.org")
+RPC_URL = os.getenv("RPC_URL", DEFAULT_RPC_URL)
+# Optional WebSocket endpoint; market status is then re-checked on each new block
+WS_RPC_URL = get_ws_rpc_url(RPC_URL)
 MOCK_USDC_ADDRESS = os.getenv("MOCK_USDC_ADDRESS")
 MARKET_ADDRESS = os.getenv("MARKET_ADDRESS")
 POOL_SWAP_TEST = os.getenv("POOL_SWAP_TEST")
@@ -28,117 +35,194 @@ PRIVATE_KEY = os.getenv("PRIVATE_KEY")
 NUM_TRADERS = int(os.getenv("NUM_TRADERS", "20"))
 NUM_PROPOSAL_AGENTS = int(os.getenv("NUM_PROPOSAL_AGENTS", "10"))
 
-# Read MARKET_ID from file created by create_market.py
-market_file = os.path.join(os.path.dirname(__file__), 'latest_market.txt')
-if os.path.exists(market_file):
-    with open(market_file, 'r') as f:
-        MARKET_ID = int(f.read().strip())
-else:
-    raise ValueError(f"No market ID file found at {market_file}. Run create_market.py first!")
+# Max funding/faucet/deposit transactions in flight at once
+FUNDING_CONCURRENCY = 10
 
-async def fund_with_gas(w3, master_account, trader_address, amount_ether="0.00001", nonce=None):
-    """Send gas (ETH) to a trader address"""
-    if nonce is None:
-        nonce = w3.eth.get_transaction_count(master_account.address)
+# Max proposal agents creating proposals at once
+PROPOSAL_CONCURRENCY = 8
 
+# Seconds between market status checks when no WebSocket endpoint is available
+MARKET_STATUS_INTERVAL = 2.0
+
+# Below this many wallets, starting worker processes costs more than it saves
+ACCOUNT_POOL_THRESHOLD = 64
+TRADE_PICK_BUFFER = 4096  # (trader, proposal) picks drawn per RNG refill
+
+# Order of the secp256k1 group; valid private keys are 1..n-1
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# Optional hex root seed for reproducible agent wallets; random per run if unset
+SWARM_SEED = bytes.fromhex(os.environ["SWARM_SEED"].removeprefix("0x")) if os.getenv("SWARM_SEED") else None
+
+# Written by create_market.py; read in main() so importing this module does no IO
+MARKET_FILE = Path(__file__).parent / 'latest_market.txt'
+
+# ERC20 fragment the swarm calls directly for MockUSDC balances
+BALANCE_OF_ABI = [{
+    "inputs": [{"name": "account", "type": "address"}],
+    "name": "balanceOf",
+    "outputs": [{"name": "", "type": "uint256"}],
+    "stateMutability": "view",
+    "type": "function"
+}]
+
+def fetch_funding_state(w3, address):
+    """Get (nonce, gas price) for the funding wallet in one JSON-RPC batch"""
+    try:
+        with w3.batch_requests() as batch:
+            batch.add(w3.eth.get_transaction_count(address))
+            batch.add(w3.eth.gas_price)
+            nonce, gas_price = batch.execute()
+        return nonce, gas_price
+    except Exception as e:
+        # Providers without batch support: fall back to individual calls
+        print(f"Batch request failed ({e}), fetching nonce and gas price individually")
+        return w3.eth.get_transaction_count(address), w3.eth.gas_price
+
+def fetch_usdc_balances(w3, addresses):
+    """Get MockUSDC balances for many addresses in one JSON-RPC batch"""
+    mock_usdc = w3.eth.contract(address=MOCK_USDC_ADDRESS, abi=BALANCE_OF_ABI)
+    try:
+        with w3.batch_requests() as batch:
+            for address in addresses:
+                batch.add(mock_usdc.functions.balanceOf(address))
+            return batch.execute()
+    except Exception as e:
+        print(f"Batch request failed ({e}), fetching balances individually")
+        return [mock_usdc.functions.balanceOf(address).call() for address in addresses]
+
+async def fund_with_gas(w3, master_account, trader_address, amount_ether, nonce, gas_price):
+    """Send gas (ETH) to a trader address
+
+    The caller assigns nonces and fetches the gas price once for the whole
+    batch, so each transfer costs one send and one receipt wait.
+    """
     tx = {
         'from': master_account.address,
         'to': trader_address,
         'value': w3.to_wei(amount_ether, 'ether'),
         'gas': 21000,
-        'gasPrice': w3.eth.gas_price,
+        'gasPrice': gas_price,
         'nonce': nonce,
     }
 
     signed_tx = master_account.sign_transaction(tx)
-    tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+    # Blocking RPCs run in threads so a batch of transfers overlaps
+    tx_hash = await asyncio.to_thread(w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+    receipt = await asyncio.to_thread(w3.eth.wait_for_transaction_receipt, tx_hash)
     return receipt
 
-async def create_trader():
-    """Create a single trader with a new wallet and assigned personality"""
-    # Generate new account
-    account = Account.create()
+def load_market_id(market_file=MARKET_FILE):
+    """Read the market ID written by create_market.py"""
+    try:
+        return int(Path(market_file).read_text().strip())
+    except FileNotFoundError:
+        raise ValueError(f"No market ID file found at {market_file}. Run create_market.py first!") from None
+
+def _derive_account(root_seed, index):
+    # Child key i is sha256(root || i); rehash in the (negligible) case it
+    # falls outside the secp256k1 key range
+    key = hashlib.sha256(root_seed + index.to_bytes(8, 'big')).digest()
+    while not 0 < int.from_bytes(key, 'big') < SECP256K1_N:
+        key = hashlib.sha256(key).digest()
+    return Account.from_key(key)
 
+def create_accounts(count, root_seed=None):
+    """Derive count new wallets from one root seed, in worker processes for large swarms
+
+    Only the root seed needs OS entropy; passing a fixed one (main uses
+    SWARM_SEED when set) reproduces a run's wallets. Address derivation is
+    pure-Python EC math (it holds the GIL), so processes rather than threads
+    are what spread it across cores.
+    """
+    if root_seed is None:
+        root_seed = os.urandom(32)
+    derive = partial(_derive_account, root_seed)
+    if count < ACCOUNT_POOL_THRESHOLD:
+        return [derive(i) for i in range(count)]
+    with ProcessPoolExecutor() as pool:
+        return list(pool.map(derive, range(count), chunksize=16))
+
+async def create_trader(account):
+    """Create a single trader for a new wallet; returns (trader, personality index)"""
     trader = TraderAgent(
         private_key=account.key.hex(),
         rpc_url=RPC_URL,
         mock_usdc_address=MOCK_USDC_ADDRESS,
         market_address=MARKET_ADDRESS,
         router_address=POOL_SWAP_TEST,
-        pool_manager_address=POOL_MANAGER
+        pool_manager_address=POOL_MANAGER,
+        w3=get_shared_web3(RPC_URL),
+        account=account
     )
 
     # Log the trader's personality
-    personality = get_trader_personality(trader.address)
-    print(f"  Created trader {trader.address[:8]}... → {personality['name']} ({personality['theme']})")
+    personality_index = get_personality_index(trader.address)
+    personality = INVISIBLE_CITIES[personality_index]
+    print(f"  Created trader {trader.address[:8]}... → {personality.name} ({personality.theme})")
 
-    return trader
-
-async def create_proposal_agent():
-    """Create a single proposal agent with a new wallet"""
-    # Generate new account
-    account = Account.create()
+    return trader, personality_index
 
+async def create_proposal_agent(account):
+    """Create a single proposal agent for a new wallet"""
     agent = ProposalAgent(
         private_key=account.key.hex(),
         rpc_url=RPC_URL,
         mock_usdc_address=MOCK_USDC_ADDRESS,
-        market_address=MARKET_ADDRESS
+        market_address=MARKET_ADDRESS,
+        w3=get_shared_web3(RPC_URL),
+        account=account
     )
 
     return agent
 
+async def gather_with_concurrency(limit, *coros, return_exceptions=False):
+    """asyncio.gather, but with at most limit of the coroutines running at once
+
+    Unlike fixed-size waves, a slot is refilled as soon as any call finishes,
+    so one slow transaction doesn't hold back the rest.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=return_exceptions)
+
 async def initialize_agents(agents, master_w3, master_account, agent_type="trader"):
     """Fund agents with gas and get MockUSDC from faucet"""
     print(f"Funding {len(agents)} {agent_type}s with gas...")
     
-    # Get starting nonce
-    base_nonce = master_w3.eth.get_transaction_count(master_account.address)
+    # Get starting nonce and a gas price shared by every funding transfer
+    base_nonce, gas_price = fetch_funding_state(master_w3, master_account.address)
     
-    # Fund with gas in batches
-    batch_size = 10
-    nonce_offset = 0
+    # Proposal agents need more gas for creating proposals
+    gas_amount = "0.0001" if agent_type == "proposal" else "0.00002"
     
-    for i in range(0, len(agents), batch_size):
-        batch = agents[i:i+batch_size]
-        tasks = []
-        
-        for j, agent in enumerate(batch):
-            # Proposal agents need more gas for creating proposals
-            gas_amount = "0.0001" if agent_type == "proposal" else "0.00002"
-            # Use sequential nonces to avoid conflicts
-            nonce = base_nonce + nonce_offset + j
-            task = fund_with_gas(master_w3, master_account, agent.address, gas_amount, nonce)
-            tasks.append(task)
-            
-        # Wait for batch to complete
-        try:
-            await asyncio.gather(*tasks)
-            nonce_offset += len(batch)
-            print(f"Successfully funded batch {i//batch_size + 1}")
-        except Exception as e:
-            print(f"ERROR funding batch: {e}")
-            import traceback
-            traceback.print_exc()
-            # Re-sync nonce on error
-            base_nonce = master_w3.eth.get_transaction_count(master_account.address)
-            nonce_offset = 0
-            raise e  # Don't continue if funding fails!
+    # Nonces are assigned up front, so transfers can complete in any order
+    tasks = [
+        fund_with_gas(master_w3, master_account, agent.address, gas_amount, base_nonce + i, gas_price)
+        for i, agent in enumerate(agents)
+    ]
+    try:
+        await gather_with_concurrency(FUNDING_CONCURRENCY, *tasks)
+        print(f"Successfully funded {len(agents)} {agent_type}s")
+    except Exception as e:
+        print(f"ERROR funding {agent_type}s: {e}")
+        import traceback
+        traceback.print_exc()
+        raise e  # Don't continue if funding fails!
     
     print(f"Getting MockUSDC from faucet for {agent_type}s...")
     
     # Initialize agents (get MockUSDC)
-    initialized = 0
-    for i in range(0, len(agents), batch_size):
-        batch = agents[i:i+batch_size]
-        tasks = [agent.initialize() for agent in batch]
-        try:
-            await asyncio.gather(*tasks)
-            initialized += len(batch)
-        except Exception as e:
-            print(f"ERROR getting faucet tokens: {e}")
-            raise e
+    try:
+        await gather_with_concurrency(FUNDING_CONCURRENCY, *(agent.initialize() for agent in agents))
+        initialized = len(agents)
+    except Exception as e:
+        print(f"ERROR getting faucet tokens: {e}")
+        raise e
     
     print(f"Successfully initialized {initialized} {agent_type}s")
 
@@ -146,28 +230,126 @@ async def launch_proposals(proposal_agents, market_id):
     """Have proposal agents create diverse AI agent proposals"""
     print(f"\nLaunching proposals from {len(proposal_agents)} agents...")
     
+    # Settle the shared proposal templates (possibly an LLM call) once, up
+    # front, rather than letting concurrent agents race to generate them
+    await asyncio.to_thread(ProposalAgent.get_agent_proposals)
+    
+    # Each agent has its own account and nonces, so proposals go out together
+    results = await gather_with_concurrency(
+        PROPOSAL_CONCURRENCY,
+        *(agent.create_proposal(market_id) for agent in proposal_agents),
+        return_exceptions=True
+    )
+    
     proposal_ids = []
-    for i, agent in enumerate(proposal_agents):
-        try:
-            # Each agent creates one unique proposal
-            receipt, proposal_id = await agent.create_proposal(market_id)
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            print(f"  ProposalAgent {i+1} failed: {result}")
+        elif result is None:
+            print(f"  ProposalAgent {i+1} failed: market not open")
+        else:
+            receipt, proposal_id = result
             if receipt and receipt['status'] == 1:
                 proposal_ids.append(proposal_id)
                 print(f"  ProposalAgent {i+1} created proposal ID {proposal_id}")
             else:
                 print(f"  ProposalAgent {i+1} transaction failed")
-        except Exception as e:
-            print(f"  ProposalAgent {i+1} failed: {e}")
     
     print(f"Created {len(proposal_ids)} proposals with IDs: {proposal_ids}")
     return proposal_ids
 
-async def trading_loop(traders, proposal_ids):
+async def watch_market_close(trader, market_id, closed):
+    """Set the closed event once market_id stops accepting trades
+
+    Status can only change with a new block, so with WS_RPC_URL it is
+    re-checked per newHeads notification; otherwise (or if the subscription
+    fails) every MARKET_STATUS_INTERVAL seconds. Either way the trading loop
+    just reads the event instead of making a status call per trade.
+    """
+    if WS_RPC_URL:
+        try:
+            async with AsyncWeb3(WebSocketProvider(WS_RPC_URL)) as ws_w3:
+                await ws_w3.eth.subscribe('newHeads')
+                async for _ in ws_w3.socket.process_subscriptions():
+                    if not await asyncio.to_thread(trader.check_market_status, market_id):
+                        closed.set()
+                        return
+        except Exception as e:
+            print(f"Block subscription failed ({e}), polling market status instead")
+    while True:
+        try:
+            if not await asyncio.to_thread(trader.check_market_status, market_id):
+                break
+        except Exception as e:
+            print(f"Market status check failed: {e}")
+        await asyncio.sleep(MARKET_STATUS_INTERVAL)
+    closed.set()
+
+def pick_trades(traders, focus_proposals, proposal_ids, buffer_size=TRADE_PICK_BUFFER):
+    """Yield (trader, proposal_id) picks forever, 70% of them on focus proposals
+
+    Draws are made buffer_size at a time with numpy so the trading loop
+    only indexes into arrays per trade.
+    """
+    rng = np.random.default_rng()
+    while True:
+        trader_idx = rng.integers(0, len(traders), size=buffer_size)
+        use_focus = rng.random(buffer_size) < 0.7 if focus_proposals else np.zeros(buffer_size, dtype=bool)
+        focus_idx = rng.integers(0, max(len(focus_proposals), 1), size=buffer_size)
+        proposal_idx = rng.integers(0, len(proposal_ids), size=buffer_size)
+        for t, f, fi, pi in zip(trader_idx.tolist(), use_focus.tolist(), focus_idx.tolist(), proposal_idx.tolist()):
+            yield traders[t], (focus_proposals[fi] if f else proposal_ids[pi])
+
+async def push_focus_proposal(trader, proposal_id, gas_price):
+    """Claim, mint and buy YES on one focus proposal to move its TWAP
+
+    The steps depend on each other and share the trader's nonces, so they
+    run in order; separate proposals (and traders) run concurrently.
+    Returns True if the closing swap went through.
+    """
+    try:
+        # Get proposal data for direct YES pool trading with larger amounts
+        proposal_data = await trader.get_proposal_data(proposal_id)
+        
+        # Claim more vUSD for larger trade
+        await trader.claim_vusd(proposal_id)
+        vusd_address = proposal_data['vUSD']
+        
+        # No need for Permit2 approval - minting uses direct approval below
+        
+        # Mint a large amount of YES/NO tokens
+        large_mint = 30 * 10**18  # Small amount for 333 token pools
+        print(f"  Minting {large_mint/10**18:.0f} vUSD worth of YES/NO for proposal {proposal_id}")
+        
+        # Approve vUSD to Market contract
+        await trader.approve_vusd_to_market(vusd_address, gas_price)
+        
+        await trader.mint_yes_no(proposal_id, large_mint)
+        
+        # Buy YES tokens with vUSD to directly push YES price up (like E2E test)
+        # First need to get more vUSD to buy with
+        buy_amount = 20 * 10**18  # Small amount for 333 token pools
+        print(f"  Buying YES tokens with {buy_amount/10**18:.0f} vUSD to drive up price for proposal {proposal_id}")
+        
+        # Buy YES tokens (vUSD -> YES)
+        # Note: execute_swap will handle approval to UniversalRouter internally
+        await trader.execute_swap(
+            pool_key=proposal_data['yesPoolKey'],
+            token_in=proposal_data['vUSD'],
+            token_out=proposal_data['yesToken'],
+            amount_in=buy_amount,
+            is_selling_decision_token=False  # We're buying decision tokens
+        )
+        print(f"  Large trade completed for proposal {proposal_id}")
+        return True
+    except Exception as e:
+        print(f"Follow-up trade error: {e}")
+        return False
+
+async def trading_loop(traders, proposal_ids, market_id):
     """Main trading loop - traders randomly trade on proposals"""
     print(f"Starting trading activity with {len(traders)} traders on {len(proposal_ids)} proposals...")
     
-    market_id = MARKET_ID
-    
     # First, have traders deposit to the market (match E2E test amounts)
     print("\nTraders depositing to market...")
     deposit_tasks = []
@@ -176,13 +358,11 @@ async def trading_loop(traders, proposal_ids):
         deposit_amount = (3000 if i < 5 else 1500) * 10**18
         deposit_tasks.append(trader.deposit_to_market(market_id, deposit_amount))
     
-    # Execute deposits in batches
-    for i in range(0, len(deposit_tasks), 10):
-        batch = deposit_tasks[i:i+10]
-        try:
-            await asyncio.gather(*batch)
-        except Exception as e:
-            print(f"Deposit batch error: {e}")
+    # Execute deposits with bounded concurrency; one failure doesn't stop the rest
+    results = await gather_with_concurrency(FUNDING_CONCURRENCY, *deposit_tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Deposit error: {result}")
     
     print("Starting continuous trading...")
     
@@ -190,7 +370,6 @@ async def trading_loop(traders, proposal_ids):
     total_trades = 0
     failed_trades = 0
     consecutive_failures = 0
-    last_yes_trade_time = {}  # Track last YES trade time per proposal
     
     # Focus on just 2-3 proposals to concentrate liquidity impact
     focus_proposals = proposal_ids[:min(3, len(proposal_ids))]
@@ -222,7 +401,6 @@ async def trading_loop(traders, proposal_ids):
                     is_selling_decision_token=False
                 )
                 
-                last_yes_trade_time[proposal_id] = asyncio.get_event_loop().time()
                 total_trades += 1
                 print(f"  Initial YES purchase completed for proposal {proposal_id}")
             except Exception as e:
@@ -232,63 +410,15 @@ async def trading_loop(traders, proposal_ids):
     await asyncio.sleep(3)
     
     print("Executing large follow-up trades to trigger TWAP and move price...")
-    for i, proposal_id in enumerate(focus_proposals):
-        if traders and len(traders) > i:
-            trader = traders[i]
-            try:
-                # Get proposal data for direct YES pool trading with larger amounts
-                proposal_data = await trader.get_proposal_data(proposal_id)
-                
-                # Claim more vUSD for larger trade
-                await trader.claim_vusd(proposal_id)
-                vusd_address = proposal_data['vUSD']
-                
-                # No need for Permit2 approval - minting uses direct approval below
-                
-                # Mint a large amount of YES/NO tokens
-                large_mint = 30 * 10**18  # Small amount for 333 token pools
-                print(f"  Minting {large_mint/10**18:.0f} vUSD worth of YES/NO for proposal {proposal_id}")
-                
-                # Approve vUSD to Market contract
-                from web3 import Web3
-                approve_abi = [{
-                    "inputs": [{"name": "spender", "type": "address"}, {"name": "amount", "type": "uint256"}],
-                    "name": "approve",
-                    "outputs": [{"name": "", "type": "bool"}],
-                    "stateMutability": "nonpayable",
-                    "type": "function"
-                }]
-                vusd_contract = trader.w3.eth.contract(address=Web3.to_checksum_address(vusd_address), abi=approve_abi)
-                tx = vusd_contract.functions.approve(trader.market_address, 2**256 - 1).build_transaction({
-                    'from': trader.address,
-                    'gas': 100000,
-                    'gasPrice': trader.w3.eth.gas_price,
-                    'nonce': trader.get_nonce(),
-                })
-                signed_tx = trader.account.sign_transaction(tx)
-                trader.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-                trader.increment_nonce()
-                
-                await trader.mint_yes_no(proposal_id, large_mint)
-                
-                # Buy YES tokens with vUSD to directly push YES price up (like E2E test)
-                # First need to get more vUSD to buy with
-                buy_amount = 20 * 10**18  # Small amount for 333 token pools
-                print(f"  Buying YES tokens with {buy_amount/10**18:.0f} vUSD to drive up price for proposal {proposal_id}")
-                
-                # Buy YES tokens (vUSD -> YES)
-                # Note: execute_swap will handle approval to UniversalRouter internally
-                await trader.execute_swap(
-                    pool_key=proposal_data['yesPoolKey'],
-                    token_in=proposal_data['vUSD'],
-                    token_out=proposal_data['yesToken'],
-                    amount_in=buy_amount,
-                    is_selling_decision_token=False  # We're buying decision tokens
-                )
-                total_trades += 1
-                print(f"  Large trade completed for proposal {proposal_id}")
-            except Exception as e:
-                print(f"Follow-up trade error: {e}")
+    # One gas price for the whole setup phase's approvals
+    gas_price = traders[0].w3.eth.gas_price if traders else None
+    
+    # Each focus proposal gets its own trader, so the chains run side by side
+    results = await asyncio.gather(*(
+        push_focus_proposal(traders[i], proposal_id, gas_price)
+        for i, proposal_id in enumerate(focus_proposals[:len(traders)])
+    ))
+    total_trades += sum(results)
     
     # Check if TWAP is now active
     market_max = traders[0].check_market_max(market_id)
@@ -299,12 +429,45 @@ async def trading_loop(traders, proposal_ids):
     
     print("\nContinuing with regular trading...")
     
+    market_closed = asyncio.Event()
+    close_watcher = asyncio.create_task(watch_market_close(traders[0], market_id, market_closed))
+    
+    # Trades run as tasks so different traders' round trips overlap; each
+    # trader has at most one in flight because its nonces are sequential
+    in_flight = {}
+    picks = pick_trades(traders, focus_proposals, proposal_ids)
+    
     while True:
+        # Collect trades that finished since the last tick
+        for busy_trader, task in list(in_flight.items()):
+            if not task.done():
+                continue
+            del in_flight[busy_trader]
+            error = task.exception()
+            if error is not None:
+                print(f"Trade error: {error}")
+                failed_trades += 1
+                consecutive_failures += 1
+                continue
+            total_trades += 1
+            consecutive_failures = 0  # Reset on success
+            
+            # Check marketMax every 10 trades
+            if total_trades % 10 == 0:
+                market_max = traders[0].check_market_max(market_id)
+                if market_max['proposalId'] > 0:
+                    print(f"  MarketMax updated: Proposal {market_max['proposalId']} with price {market_max['yesPrice']}")
+                else:
+                    print(f"  MarketMax still 0 after {total_trades} trades")
+        
         # Check if market is still open
-        if not traders[0].check_market_status(market_id):
+        if market_closed.is_set():
             print(f"\n{'='*50}")
             print(f"Market {market_id} deadline has passed. Graduating market...")
             
+            # Let in-flight trades land so graduation doesn't race their nonces
+            await asyncio.gather(*in_flight.values(), return_exceptions=True)
+            
             # Graduate the market to finalize the winner
             try:
                 await traders[0].graduate_market(market_id)
@@ -329,7 +492,7 @@ async def trading_loop(traders, proposal_ids):
                 # Launch agent token
                 print("\nLaunching agent token...")
                 launcher = AgentTokenLauncher()
-                launch_result = await launcher.launch_agent_token(market_id)
+                launch_result = await launcher.launch_agent_token(market_id, winning_proposal)
                 
                 if launch_result:
                     print(f"Agent token launched successfully!")
@@ -340,29 +503,11 @@ async def trading_loop(traders, proposal_ids):
             break
         
         # Pick random trader and proposal (70% chance to pick focus proposals)
-        trader = random.choice(traders)
-        if random.random() < 0.7 and focus_proposals:
-            proposal_id = random.choice(focus_proposals)
-        else:
-            proposal_id = random.choice(proposal_ids)
+        trader, proposal_id = next(picks)
         
-        # Execute trade
-        try:
-            await trader.trade(proposal_id, market_id)
-            total_trades += 1
-            consecutive_failures = 0  # Reset on success
-            
-            # Check marketMax every 10 trades
-            if total_trades % 10 == 0:
-                market_max = traders[0].check_market_max(market_id)
-                if market_max['proposalId'] > 0:
-                    print(f"  MarketMax updated: Proposal {market_max['proposalId']} with price {market_max['yesPrice']}")
-                else:
-                    print(f"  MarketMax still 0 after {total_trades} trades")
-        except Exception as e:
-            print(f"Trade error: {e}")
-            failed_trades += 1
-            consecutive_failures += 1
+        # Start the trade unless this trader is still busy with its last one
+        if trader not in in_flight:
+            in_flight[trader] = asyncio.create_task(trader.trade(proposal_id, market_id))
         
         # Check if we should graduate the market
         if consecutive_failures > 20 or (total_trades > 100 and failed_trades > total_trades * 0.5):
@@ -373,16 +518,16 @@ async def trading_loop(traders, proposal_ids):
             print(f"  Consecutive failures: {consecutive_failures}")
             
             # Check collective balance
-            total_balance = 0
-            for t in traders:
-                balance = t.get_balance()
-                total_balance += balance
+            balances = await asyncio.to_thread(fetch_usdc_balances, traders[0].w3, [t.address for t in traders])
+            total_balance = sum(balances)
             
             readable_balance = total_balance / 10**18  # Assuming 18 decimals
             print(f"  Total USDC balance across all traders: {readable_balance:.2f}")
             
             if consecutive_failures > 20 or readable_balance < 100:
                 print(f"\nAttempting to graduate market {market_id}...")
+                await asyncio.gather(*in_flight.values(), return_exceptions=True)
+                in_flight.clear()
                 try:
                     # Use first trader to graduate the market
                     await traders[0].graduate_market(market_id)
@@ -398,7 +543,7 @@ async def trading_loop(traders, proposal_ids):
                         
                         print("\nLaunching agent token...")
                         launcher = AgentTokenLauncher()
-                        launch_result = await launcher.launch_agent_token(market_id)
+                        launch_result = await launcher.launch_agent_token(market_id, winning_proposal)
                         
                         if launch_result:
                             print(f"Agent token launched successfully!")
@@ -415,14 +560,18 @@ async def trading_loop(traders, proposal_ids):
                     else:
                         break
         
-        # Wait a bit before next trade (10 trades per second)
+        # Wait a bit before starting the next trade (10 trades per second)
         await asyncio.sleep(0.1)
+    
+    close_watcher.cancel()
 
 async def main():
     """Main function to start the swarm"""
     print("Starting Zobeide Swarm")
     print("="*50)
     
+    market_id = load_market_id()
+    
     # Show AI market conditions that will influence trading
     print("\nAI Market Analysis (from Allora Network):")
     from src.allora_game_agent.allora_game_agent import get_virtual_price
@@ -442,7 +591,7 @@ async def main():
         print("ERROR: PRIVATE_KEY not set in .env")
         return
 
-    master_w3 = Web3(Web3.HTTPProvider(RPC_URL))
+    master_w3 = get_shared_web3(RPC_URL)
     master_account = Account.from_key(PRIVATE_KEY)
 
     print(f"\nMaster wallet: {master_account.address}")
@@ -452,8 +601,11 @@ async def main():
     # Phase 1: Create Proposal Agents
     print(f"\nPhase 1: Creating {NUM_PROPOSAL_AGENTS} Proposal Agents...")
     proposal_agents = []
-    for i in range(NUM_PROPOSAL_AGENTS):
-        agent = await create_proposal_agent()
+    # Proposal agents and traders take separate children of the root seed
+    root_seed = SWARM_SEED or os.urandom(32)
+    accounts = await asyncio.to_thread(create_accounts, NUM_PROPOSAL_AGENTS, hashlib.sha256(root_seed + b"proposal").digest())
+    for i, account in enumerate(accounts):
+        agent = await create_proposal_agent(account)
         proposal_agents.append(agent)
         print(f"  Created ProposalAgent {i+1}: {agent.address[:8]}...")
     
@@ -462,7 +614,7 @@ async def main():
     
     # Phase 2: Launch Proposals
     print(f"\nPhase 2: Launching AI Agent Proposals...")
-    proposal_ids = await launch_proposals(proposal_agents, MARKET_ID)
+    proposal_ids = await launch_proposals(proposal_agents, market_id)
     
     if not proposal_ids:
         print("No proposals created. Check market status and configuration.")
@@ -471,37 +623,39 @@ async def main():
     # Phase 3: Create Trading Agents
     print(f"\nPhase 3: Creating {NUM_TRADERS} Trading Agents with Diverse Personalities...")
     traders = []
-    personality_counts = {}
+    personality_indices = []
     
-    for i in range(NUM_TRADERS):
-        trader = await create_trader()
+    accounts = await asyncio.to_thread(create_accounts, NUM_TRADERS, hashlib.sha256(root_seed + b"trader").digest())
+    for i, account in enumerate(accounts):
+        trader, personality_index = await create_trader(account)
         traders.append(trader)
-        
-        # Track personality distribution
-        personality = get_trader_personality(trader.address)
-        personality_key = personality['name']
-        personality_counts[personality_key] = personality_counts.get(personality_key, 0) + 1
+        personality_indices.append(personality_index)
         
         if i % 100 == 0 and i > 0:
             print(f"  Created {i} traders...")
     
     # Show personality distribution
+    personality_idx = np.array(personality_indices, dtype=np.intp)
+    counts = np.bincount(personality_idx, minlength=len(INVISIBLE_CITIES))
     print(f"\nTrader Personality Distribution:")
-    for name, count in sorted(personality_counts.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {name}: {count} trader{'s' if count > 1 else ''}")
+    for i in np.argsort(-counts, kind="stable"):
+        if counts[i]:
+            print(f"  {INVISIBLE_CITIES[i].name}: {counts[i]} trader{'s' if counts[i] > 1 else ''}")
     
     # Initialize all traders
     await initialize_agents(traders, master_w3, master_account, "trader")
     
     # Phase 4: Start Trading
     print(f"\nPhase 4: Starting Trading Activity...")
-    print(f"  Market ID: {MARKET_ID}")
+    print(f"  Market ID: {market_id}")
     print(f"  Active Proposals: {len(proposal_ids)}")
     print(f"  Active Traders: {len(traders)}")
     print("="*50)
     
     # Start trading
-    await trading_loop(traders, proposal_ids)
+    await trading_loop(traders, proposal_ids, market_id)
 
 if __name__ == "__main__":
+    # Agent modules log their per-trade decisions; keep them on stdout with the prints
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(main())
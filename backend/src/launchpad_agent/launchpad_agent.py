@@ -2,36 +2,128 @@
 Agent Token Launchpad
 Launches agent tokens when markets graduate
 """
+import logging
 import os
-import json
-from web3 import Web3
+import re
+import statistics
+import sys
+import time
+import requests
+from web3 import AsyncWeb3, Web3, WebSocketProvider
+from web3.exceptions import TransactionNotFound
 from eth_account import Account
+from eth_abi import encode as abi_encode
 from typing import Dict, Optional, Tuple
 import asyncio
 from dotenv import load_dotenv
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Seconds fetched fee parameters stay valid (about one block)
+FEE_TTL = 12
+
+# Floor for the EIP-1559 priority fee (1 gwei)
+MIN_PRIORITY_FEE = 10**9
+
+# Static gas limits per transaction type
+FAUCET_GAS = 100000
+APPROVE_GAS = 100000
+LAUNCH_GAS = 5000000  # Much higher gas limit for token creation
+
+# Bonding allowance approved per launch; covers many launches
+APPROVE_AMOUNT = Web3.to_wei(1000000, 'ether')  # 1M MockUSDC
+
+# Times to retry the faucet/approve/launch pipeline if a transaction fails
+LAUNCH_ATTEMPTS = 2
+
+# Backoff bounds (seconds) when polling a market past its deadline for graduation
+MONITOR_MIN_DELAY = 1
+MONITOR_MAX_DELAY = 10
+
+# Receipt polling: seconds between checks and before giving up
+RECEIPT_POLL_INTERVAL = 0.5
+RECEIPT_TIMEOUT = 120
+
+# Seconds a looked-up winning proposal is reused, across launcher instances
+WINNING_PROPOSAL_TTL = 60
+
+# market_id -> (monotonic fetch time, proposal dict from get_winning_proposal)
+_winning_proposals: Dict[int, Tuple[float, Dict]] = {}
+
+# Max keep-alive sockets per shared client, i.e. how many web3 calls running
+# in worker threads can be in flight at once (the swarm runs many agents)
+W3_POOL_SIZE = int(os.getenv('W3_POOL_SIZE', '16'))
+
+# RPC endpoint used when neither an explicit URL nor RPC_URL is given
+DEFAULT_RPC_URL = 'https://sepolia.base.org'
+
+# Web3 clients shared by every launcher and swarm agent, keyed by RPC URL, so
+# they reuse one keep-alive connection pool instead of each reconnecting
+_shared_web3: Dict[Optional[str], Web3] = {}
+
+
+def get_shared_web3(rpc_url: Optional[str] = None) -> Web3:
+    """Return the process-wide Web3 client for rpc_url (default RPC_URL)"""
+    rpc_url = rpc_url or os.getenv('RPC_URL', DEFAULT_RPC_URL)
+    w3 = _shared_web3.get(rpc_url)
+    if w3 is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=W3_POOL_SIZE)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={'timeout': 30}, session=session))
+        _shared_web3[rpc_url] = w3
+    return w3
+
+
+def get_ws_rpc_url(rpc_url: Optional[str] = None) -> Optional[str]:
+    """WebSocket RPC endpoint from WS_RPC_URL, or rpc_url (default RPC_URL) if it is one"""
+    url = os.getenv('WS_RPC_URL') or rpc_url or os.getenv('RPC_URL') or ''
+    return url if url.startswith(('ws://', 'wss://')) else None
+
+# Anything str.isalnum() rejects (the regex engine's \w is isalnum() plus "_")
+NON_ALNUM = re.compile(r'[\W_]+')
+
+# acceptedProposals(uint256) selector; graduation polls build calldata from it
+# directly instead of going through the contract function machinery
+ACCEPTED_PROPOSALS_SELECTOR = bytes(Web3.keccak(text='acceptedProposals(uint256)')[:4])
+
+# MockUSDC selectors for the funding transactions, whose calldata never changes
+FAUCET_SELECTOR = bytes(Web3.keccak(text='faucet()')[:4])
+APPROVE_SELECTOR = bytes(Web3.keccak(text='approve(address,uint256)')[:4])
+
 # Contract ABIs
-MARKET_ABI = json.loads('''[
+MARKET_ABI = json_loads('''[
+    {"inputs":[{"name":"marketId","type":"uint256"}],"name":"markets","outputs":[{"name":"id","type":"uint256"},{"name":"createdAt","type":"uint256"},{"name":"minDeposit","type":"uint256"},{"name":"deadline","type":"uint256"},{"name":"creator","type":"address"},{"name":"marketToken","type":"address"},{"name":"resolver","type":"address"},{"name":"status","type":"uint8"},{"name":"title","type":"string"}],"stateMutability":"view","type":"function"},
     {"inputs":[{"name":"marketId","type":"uint256"}],"name":"acceptedProposals","outputs":[{"name":"","type":"uint256"}],"stateMutability":"view","type":"function"},
     {"inputs":[{"name":"proposalId","type":"uint256"}],"name":"proposals","outputs":[{"name":"id","type":"uint256"},{"name":"marketId","type":"uint256"},{"name":"createdAt","type":"uint256"},{"name":"creator","type":"address"},{"name":"vUSD","type":"address"},{"name":"yesToken","type":"address"},{"name":"noToken","type":"address"},{"name":"yesPoolKey","type":"tuple","components":[{"name":"currency0","type":"address"},{"name":"currency1","type":"address"},{"name":"fee","type":"uint24"},{"name":"tickSpacing","type":"int24"},{"name":"hooks","type":"address"}]},{"name":"noPoolKey","type":"tuple","components":[{"name":"currency0","type":"address"},{"name":"currency1","type":"address"},{"name":"fee","type":"uint24"},{"name":"tickSpacing","type":"int24"},{"name":"hooks","type":"address"}]},{"name":"data","type":"bytes"}],"stateMutability":"view","type":"function"}
 ]''')
 
-BONDING_ABI = json.loads('''[
+BONDING_ABI = json_loads('''[
     {"inputs":[{"name":"_name","type":"string"},{"name":"_ticker","type":"string"},{"name":"purchaseAmount","type":"uint256"},{"name":"assetToken","type":"address"}],"name":"launchWithAsset","outputs":[{"name":"","type":"address"},{"name":"","type":"address"},{"name":"","type":"uint256"}],"stateMutability":"nonpayable","type":"function"}
 ]''')
 
-MOCK_USDC_ABI = json.loads('''[
+MOCK_USDC_ABI = json_loads('''[
     {"inputs":[{"name":"spender","type":"address"},{"name":"amount","type":"uint256"}],"name":"approve","outputs":[{"name":"","type":"bool"}],"stateMutability":"nonpayable","type":"function"},
     {"inputs":[{"name":"account","type":"address"}],"name":"balanceOf","outputs":[{"name":"","type":"uint256"}],"stateMutability":"view","type":"function"},
     {"inputs":[],"name":"faucet","outputs":[],"stateMutability":"nonpayable","type":"function"}
 ]''')
 
 class AgentTokenLauncher:
-    def __init__(self, private_key: str = None):
-        """Initialize the agent token launcher"""
-        self.w3 = Web3(Web3.HTTPProvider(os.getenv('RPC_URL')))
+    def __init__(self, private_key: str = None, w3: Optional[Web3] = None):
+        """Initialize the agent token launcher
+
+        Pass w3 to reuse an existing client (and its connection pool);
+        otherwise the shared client for RPC_URL is used.
+        """
+        self.w3 = w3 or get_shared_web3()
 
         # Use provided private key or default to PRIVATE_KEY
         self.private_key = private_key or os.getenv('PRIVATE_KEY')
@@ -47,35 +139,131 @@ class AgentTokenLauncher:
         self.bonding = self.w3.eth.contract(address=self.bonding_address, abi=BONDING_ABI)
         self.mock_usdc = self.w3.eth.contract(address=self.mock_usdc_address, abi=MOCK_USDC_ABI)
 
+        # Bind contract functions once instead of resolving them per call
+        self._proposals_fn = self.market.functions.proposals
+        self._markets_fn = self.market.functions.markets
+        self._balance_of_fn = self.mock_usdc.functions.balanceOf
+        self._launch_fn = self.bonding.functions.launchWithAsset
+
+        # Fields shared by every transaction; chainId is filled in on first use
+        self._tx_template = {'from': self.account.address}
+
+        # Funding calls are identical every launch, so encode them once; only
+        # nonce and fees change per transaction
+        self._faucet_call = {'to': self.mock_usdc_address, 'data': FAUCET_SELECTOR}
+        self._approve_call = {
+            'to': self.mock_usdc_address,
+            'data': APPROVE_SELECTOR + abi_encode(['address', 'uint256'], [self.bonding_address, APPROVE_AMOUNT])
+        }
+
         # Launch configuration
         self.launch_fee = Web3.to_wei(100, 'ether')  # 100 MockUSDC
         self.initial_purchase = Web3.to_wei(10, 'ether')  # 10 MockUSDC initial purchase
+
+        # (timestamp, fee params) of the last fee history fetch
+        self._fee_cache: Optional[Tuple[float, Dict]] = None
+
+        # Next nonce after our own confirmed launches; the node's pending count
+        # can lag behind transactions we've just broadcast
+        self._next_nonce: Optional[int] = None
+
+        # (label, tx hash) of transactions broadcast for the current launch
+        self.pending_txs = []
+        self.receipts = []
+
+    def _cache_fee_history(self, history) -> Dict:
+        """Derive EIP-1559 fee fields from a fee_history result and cache them"""
+        base_fee = history['baseFeePerGas'][-1]
+        # Median 50th-percentile tip over the sampled blocks, so one outlier block doesn't set it
+        tip = max(statistics.median_low(r[0] for r in history['reward']), MIN_PRIORITY_FEE)
+        self._fee_cache = (time.time(), {
+            'type': 2,
+            'maxFeePerGas': base_fee * 2 + tip,
+            'maxPriorityFeePerGas': tip
+        })
+        return self._fee_cache[1]
+
+    def get_fee_params(self) -> Dict:
+        """Get EIP-1559 fee fields from recent fee history, cached for about one block"""
+        if self._fee_cache is None or time.time() - self._fee_cache[0] > FEE_TTL:
+            return self._cache_fee_history(self.w3.eth.fee_history(5, 'latest', [50]))
+        return self._fee_cache[1]
+
+    def prefetch_launch_state(self) -> Tuple[int, int]:
+        """Fetch everything a launch reads up front in one JSON-RPC batch
+
+        Returns (MockUSDC balance, pending nonce) and fills the fee and chainId
+        caches used by _tx_params, so building the launch transactions needs
+        no further reads.
+        """
+        address = self.account.address
+        try:
+            with self.w3.batch_requests() as batch:
+                batch.add(self._balance_of_fn(address))
+                batch.add(self.w3.eth.get_transaction_count(address, 'pending'))
+                batch.add(self.w3.eth.fee_history(5, 'latest', [50]))
+                batch.add(self.w3.eth.chain_id)
+                balance, nonce, history, chain_id = batch.execute()
+        except Exception as e:
+            # Providers without batch support: fall back to individual calls
+            logger.warning("Batch request failed (%s), fetching launch state individually", e)
+            return self._balance_of_fn(address).call(), self.w3.eth.get_transaction_count(address, 'pending')
+
+        self._cache_fee_history(history)
+        self._tx_template['chainId'] = chain_id
+        return balance, nonce
+
+    def _tx_params(self, nonce: int, gas: int) -> Dict:
+        """Build transaction params from the shared template"""
+        if 'chainId' not in self._tx_template:
+            self._tx_template['chainId'] = self.w3.eth.chain_id
+        return {**self._tx_template, **self.get_fee_params(), 'nonce': nonce, 'gas': gas}
         
-    def get_winning_proposal(self, market_id: int) -> Optional[Dict]:
-        """Get the winning proposal for a graduated market"""
+    def get_accepted_proposal_id(self, market_id: int) -> int:
+        """Read acceptedProposals(market_id); 0 while the market hasn't graduated"""
+        result = self.w3.eth.call({
+            'to': self.market_address,
+            'data': ACCEPTED_PROPOSALS_SELECTOR + market_id.to_bytes(32, 'big')
+        })
+        return int.from_bytes(result[:32], 'big')
+
+    def get_winning_proposal(self, market_id: int, proposal_id: Optional[int] = None) -> Optional[Dict]:
+        """Get the winning proposal for a graduated market
+
+        Pass proposal_id when the accepted proposal is already known to skip
+        re-reading acceptedProposals. Results are reused for
+        WINNING_PROPOSAL_TTL seconds.
+        """
+        cached = _winning_proposals.get(market_id)
+        if (cached is not None and time.monotonic() - cached[0] < WINNING_PROPOSAL_TTL
+                and proposal_id in (None, cached[1]['id'])):
+            return cached[1]
+
         try:
             # Get accepted proposal ID
-            proposal_id = self.market.functions.acceptedProposals(market_id).call()
+            if proposal_id is None:
+                proposal_id = self.get_accepted_proposal_id(market_id)
 
             if proposal_id == 0:
-                print(f"No accepted proposal for market {market_id}")
+                logger.info("No accepted proposal for market %s", market_id)
                 return None
 
             # Get proposal data
-            proposal = self.market.functions.proposals(proposal_id).call()
+            proposal = self._proposals_fn(proposal_id).call()
 
             # Proposal struct: (id, marketId, createdAt, creator, vUSD, yesToken, noToken,
             #                   yesPoolKey, noPoolKey, data)
             # data is bytes at index 9
             context_bytes = proposal[9]
 
-            # Decode bytes to string
+            # The ABI decoder already sliced the dynamic bytes field; parse it
+            # directly and reject anything that isn't a JSON object
+            context_json = json_loads(context_bytes)
+            if not isinstance(context_json, dict):
+                raise ValueError(f"Proposal {proposal_id} data is not a JSON object")
             context_str = context_bytes.decode('utf-8')
 
-            # Parse JSON
-            context_json = json.loads(context_str)
-
-            return {
+            winning = {
                 'id': proposal_id,
                 'marketId': market_id,
                 'proposalId': proposal_id,
@@ -85,10 +273,10 @@ class AgentTokenLauncher:
                 'symbol': context_json.get('symbol', ''),
                 'type': context_json.get('type', 'AI_AGENT')
             }
+            _winning_proposals[market_id] = (time.monotonic(), winning)
+            return winning
         except Exception as e:
-            print(f"Error getting winning proposal: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error getting winning proposal: %s", e)
             return None
     
     def prepare_token_metadata(self, proposal: Dict) -> Tuple[str, str]:
@@ -104,125 +292,140 @@ class AgentTokenLauncher:
             ticker = agent_name.upper()[:6] if agent_name else "AGENT"
         
         # Ensure ticker is alphanumeric only
-        ticker = ''.join(c for c in ticker if c.isalnum())
+        ticker = NON_ALNUM.sub('', ticker)
         
         return agent_name, ticker
     
     async def ensure_launch_funds(self) -> bool:
-        """Ensure launcher has enough MockUSDC for launch"""
+        """
+        Queue the faucet (if needed) and approve transactions for a launch.
+
+        Transactions are broadcast back-to-back with sequential nonces without
+        waiting for receipts; their hashes are collected in self.pending_txs.
+
+        Returns:
+            The next unused nonce, or False on error
+        """
         try:
-            # Check MockUSDC balance
-            balance = self.mock_usdc.functions.balanceOf(self.account.address).call()
+            self.pending_txs = []
+
+            # Check MockUSDC balance and fetch the nonce (plus fees and chain id)
+            balance, nonce = await asyncio.to_thread(self.prefetch_launch_state)
+            if self._next_nonce is not None:
+                nonce = max(nonce, self._next_nonce)
             required = self.launch_fee + self.initial_purchase
 
             if balance < required:
-                print(f"Insufficient MockUSDC. Have: {Web3.from_wei(balance, 'ether')}, Need: {Web3.from_wei(required, 'ether')}")
+                logger.info("Insufficient MockUSDC. Have: %s, Need: %s", Web3.from_wei(balance, 'ether'), Web3.from_wei(required, 'ether'))
 
                 # Call faucet to get MockUSDC (faucet gives 1000 USDC per call)
-                print(f"Calling MockUSDC faucet...")
+                logger.info("Calling MockUSDC faucet...")
 
-                nonce = self.w3.eth.get_transaction_count(self.account.address)
-                tx = self.mock_usdc.functions.faucet().build_transaction({
-                    'from': self.account.address,
-                    'nonce': nonce,
-                    'gas': 100000,
-                    'gasPrice': self.w3.eth.gas_price
-                })
+                tx = {**self._tx_params(nonce, FAUCET_GAS), **self._faucet_call}
 
                 signed_tx = self.w3.eth.account.sign_transaction(tx, self.private_key)
-                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+                tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+                self.pending_txs.append(('faucet', tx_hash))
 
-                if receipt.status != 1:
-                    print("Failed to get MockUSDC from faucet")
-                    return False
-
-                print(f"Got MockUSDC from faucet successfully: {tx_hash.hex()}")
+                logger.info("Faucet transaction sent: %s", tx_hash.hex())
+                nonce += 1
 
             # Approve Bonding contract to spend MockUSDC
-            print("Approving Bonding contract to spend MockUSDC...")
-            nonce = self.w3.eth.get_transaction_count(self.account.address)
-            approve_amount = Web3.to_wei(1000000, 'ether')  # Approve 1M MockUSDC for multiple launches
-            tx = self.mock_usdc.functions.approve(
-                self.bonding_address,
-                approve_amount
-            ).build_transaction({
-                'from': self.account.address,
-                'nonce': nonce,
-                'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price
-            })
+            logger.info("Approving Bonding contract to spend MockUSDC...")
+            tx = {**self._tx_params(nonce, APPROVE_GAS), **self._approve_call}
 
             signed_tx = self.w3.eth.account.sign_transaction(tx, self.private_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-
-            if receipt.status != 1:
-                print("Failed to approve MockUSDC")
-                return False
+            tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+            self.pending_txs.append(('approve', tx_hash))
 
-            print(f"Approved MockUSDC successfully: {tx_hash.hex()}")
+            logger.info("Approve transaction sent: %s", tx_hash.hex())
 
-            # Return the nonce that was just used so we can increment it
+            # Return the next nonce so the launch can follow immediately
             return nonce + 1
 
         except Exception as e:
-            print(f"Error ensuring launch funds: {e}")
+            logger.error("Error ensuring launch funds: %s", e)
             return False
+
+    async def await_receipt(self, tx_hash):
+        """Poll for a transaction receipt without holding a worker thread between checks"""
+        deadline = time.monotonic() + RECEIPT_TIMEOUT
+        while True:
+            try:
+                return await asyncio.to_thread(self.w3.eth.get_transaction_receipt, tx_hash)
+            except TransactionNotFound:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Transaction {tx_hash.hex()} not mined after {RECEIPT_TIMEOUT}s")
+            await asyncio.sleep(RECEIPT_POLL_INTERVAL)
+
+    async def wait_for_pending_txs(self) -> list:
+        """Wait for all pending transactions and return the labels of any that failed"""
+        receipts = await asyncio.gather(*(
+            self.await_receipt(tx_hash) for _, tx_hash in self.pending_txs
+        ))
+        self.receipts = receipts
+        return [label for (label, _), receipt in zip(self.pending_txs, receipts) if receipt.status != 1]
     
-    async def launch_agent_token(self, market_id: int) -> Optional[Dict]:
+    async def launch_agent_token(self, market_id: int, proposal_id: Optional[int] = None) -> Optional[Dict]:
         """Launch an agent token for a graduated market"""
         try:
             # Get winning proposal
-            proposal = self.get_winning_proposal(market_id)
+            proposal = self.get_winning_proposal(market_id, proposal_id)
             if not proposal:
-                print(f"No winning proposal found for market {market_id}")
+                logger.warning("No winning proposal found for market %s", market_id)
                 return None
             
-            print(f"Launching token for agent: {proposal['agentName']}")
+            logger.info("Launching token for agent: %s", proposal['agentName'])
             
             # Prepare token metadata
             name, ticker = self.prepare_token_metadata(proposal)
-            print(f"Token: {name} ({ticker})")
-            
-            # Ensure we have funds and get the next nonce
-            next_nonce = await self.ensure_launch_funds()
-            if next_nonce is False:
-                print("Failed to secure launch funds")
-                return None
+            logger.info("Token: %s (%s)", name, ticker)
 
-            # Launch token via Bonding contract
-            purchase_amount = self.launch_fee + self.initial_purchase
-
-            print(f"Launching with {Web3.from_wei(purchase_amount, 'ether')} MockUSDC...")
-
-            nonce = next_nonce
-            tx = self.bonding.functions.launchWithAsset(
-                name,
-                ticker,
-                purchase_amount,
-                self.mock_usdc_address
-            ).build_transaction({
-                'from': self.account.address,
-                'nonce': nonce,
-                'gas': 5000000,  # Much higher gas limit for token creation
-                'gasPrice': self.w3.eth.gas_price
-            })
-            
-            signed_tx = self.w3.eth.account.sign_transaction(tx, self.private_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            
-            print(f"Launch transaction sent: {tx_hash.hex()}")
-            print("Waiting for confirmation...")
-            
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-            
-            if receipt.status != 1:
-                print(f"Launch transaction failed")
+            for attempt in range(LAUNCH_ATTEMPTS):
+                # Queue funding transactions and get the next nonce
+                next_nonce = await self.ensure_launch_funds()
+                if next_nonce is False:
+                    logger.error("Failed to secure launch funds")
+                    return None
+
+                # Launch token via Bonding contract
+                purchase_amount = self.launch_fee + self.initial_purchase
+
+                logger.info("Launching with %s MockUSDC...", Web3.from_wei(purchase_amount, 'ether'))
+
+                tx = self._launch_fn(
+                    name,
+                    ticker,
+                    purchase_amount,
+                    self.mock_usdc_address
+                ).build_transaction(self._tx_params(next_nonce, LAUNCH_GAS))
+
+                signed_tx = self.w3.eth.account.sign_transaction(tx, self.private_key)
+                tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+                self.pending_txs.append(('launch', tx_hash))
+
+                logger.info("Launch transaction sent: %s", tx_hash.hex())
+                logger.info("Waiting for confirmation...")
+
+                failed = await self.wait_for_pending_txs()
+                if not failed:
+                    self._next_nonce = next_nonce + 1
+                    break
+
+                logger.warning("Launch pipeline failed at: %s", ', '.join(failed))
+                # Start the next attempt from fresh chain state
+                self._fee_cache = None
+                self._next_nonce = None
+            else:
+                logger.error("Launch transaction failed")
                 return None
+
+            receipt = self.receipts[-1]
+            _winning_proposals.pop(market_id, None)
             
-            print(f"Agent token launched successfully!")
-            print(f"Transaction: {tx_hash.hex()}")
+            logger.info("Agent token launched successfully!")
+            logger.info("Transaction: %s", tx_hash.hex())
             
             # Parse events to get token address (would need event ABI)
             # For now, return transaction info
@@ -235,39 +438,78 @@ class AgentTokenLauncher:
             }
             
         except Exception as e:
-            print(f"Error launching agent token: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error launching agent token: %s", e)
             return None
     
     async def monitor_and_launch(self, market_id: int):
         """Monitor a market and launch token when it graduates"""
-        print(f"Monitoring market {market_id} for graduation...")
-        
+        logger.info("Monitoring market %s for graduation...", market_id)
+
+        # Market emits no graduation event and graduateMarket reverts until the
+        # deadline has passed, so sleep until then instead of polling
+        try:
+            deadline = self._markets_fn(market_id).call()[3]
+            wait = deadline - time.time()
+            if wait > 0:
+                logger.info("Market %s deadline in %.0fs, waiting...", market_id, wait)
+                await asyncio.sleep(wait)
+        except Exception as e:
+            logger.warning("Error reading market deadline: %s", e)
+
+        # Graduation emits no event, but it can only land in a new block; with a
+        # WebSocket endpoint, check once per block instead of polling blindly
+        ws_url = get_ws_rpc_url()
+        if ws_url:
+            try:
+                proposal_id = await self.wait_for_graduation_ws(market_id, ws_url)
+            except Exception as e:
+                logger.warning("Block subscription failed (%s), falling back to polling", e)
+                proposal_id = None
+            if proposal_id:
+                return await self.launch_graduated(market_id, proposal_id)
+
+        delay = MONITOR_MIN_DELAY
         while True:
             try:
                 # Check if market has a winner
-                proposal_id = self.market.functions.acceptedProposals(market_id).call()
+                proposal_id = self.get_accepted_proposal_id(market_id)
                 
                 if proposal_id > 0:
-                    print(f"Market {market_id} has graduated! Winner: Proposal {proposal_id}")
-                    
-                    # Launch the token
-                    result = await self.launch_agent_token(market_id)
-                    
-                    if result:
-                        print(f"Successfully launched token for market {market_id}")
-                        return result
-                    else:
-                        print(f"Failed to launch token for market {market_id}")
-                        return None
-                
-                # Wait before checking again
-                await asyncio.sleep(10)
+                    return await self.launch_graduated(market_id, proposal_id)
                 
             except Exception as e:
-                print(f"Error monitoring market: {e}")
-                await asyncio.sleep(10)
+                logger.warning("Error monitoring market: %s", e)
+
+            # Back off until the next check
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MONITOR_MAX_DELAY)
+
+    async def wait_for_graduation_ws(self, market_id: int, ws_url: str) -> int:
+        """Check acceptedProposals on every new block until the market graduates"""
+        call = {
+            'to': self.market_address,
+            'data': ACCEPTED_PROPOSALS_SELECTOR + market_id.to_bytes(32, 'big')
+        }
+        async with AsyncWeb3(WebSocketProvider(ws_url)) as w3:
+            await w3.eth.subscribe('newHeads')
+            async for _ in w3.socket.process_subscriptions():
+                proposal_id = int.from_bytes((await w3.eth.call(call))[:32], 'big')
+                if proposal_id > 0:
+                    return proposal_id
+
+    async def launch_graduated(self, market_id: int, proposal_id: int) -> Optional[Dict]:
+        """Launch the token for a market that has graduated"""
+        logger.info("Market %s has graduated! Winner: Proposal %s", market_id, proposal_id)
+
+        # Launch the token
+        result = await self.launch_agent_token(market_id, proposal_id)
+
+        if result:
+            logger.info("Successfully launched token for market %s", market_id)
+            return result
+        else:
+            logger.error("Failed to launch token for market %s", market_id)
+            return None
 
 
 async def main():
@@ -278,17 +520,18 @@ async def main():
     market_id = 1
     
     # Try to launch immediately (if already graduated)
-    proposal_id = launcher.market.functions.acceptedProposals(market_id).call()
+    proposal_id = launcher.get_accepted_proposal_id(market_id)
     
     if proposal_id > 0:
-        print(f"Market {market_id} already graduated. Launching token...")
-        result = await launcher.launch_agent_token(market_id)
-        print(f"Launch result: {result}")
+        logger.info("Market %s already graduated. Launching token...", market_id)
+        result = await launcher.launch_agent_token(market_id, proposal_id)
+        logger.info("Launch result: %s", result)
     else:
-        print(f"Market {market_id} not yet graduated. Monitoring...")
+        logger.info("Market %s not yet graduated. Monitoring...", market_id)
         result = await launcher.monitor_and_launch(market_id)
-        print(f"Launch result: {result}")
+        logger.info("Launch result: %s", result)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(main())
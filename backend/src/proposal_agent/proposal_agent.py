@@ -1,6 +1,8 @@
 """ProposalAgent for creating AI agent proposals in prediction markets"""
+import asyncio
 import json
 import random
+from dataclasses import asdict
 import requests
 from web3 import Web3
 from eth_account import Account
@@ -100,9 +102,11 @@ JSON array:"""
         print("Using hardcoded proposals as fallback")
         return HARDCODED_PROPOSALS
     
-    def __init__(self, private_key, rpc_url, mock_usdc_address, market_address):
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        self.account = Account.from_key(private_key)
+    def __init__(self, private_key, rpc_url, mock_usdc_address, market_address, w3=None, account=None):
+        # Pass w3 to share one client (and connection pool) across agents, and
+        # account when the caller already derived it from private_key
+        self.w3 = w3 or Web3(Web3.HTTPProvider(rpc_url))
+        self.account = account or Account.from_key(private_key)
         self.mock_usdc_address = mock_usdc_address
         self.market_address = market_address
         self.funded = False
@@ -190,7 +194,7 @@ JSON array:"""
         }]
         
         market = self.w3.eth.contract(address=self.market_address, abi=market_abi)
-        market_config = market.functions.markets(market_id).call()
+        market_config = await asyncio.to_thread(market.functions.markets(market_id).call)
         return {
             'id': market_config[0],
             'minDeposit': market_config[2],
@@ -255,6 +259,10 @@ JSON array:"""
             # Use dynamically generated proposals or fallback
             available_proposals = self.get_agent_proposals()
             agent_template = random.choice(available_proposals)
+
+        # LLM proposals are dicts; hardcoded templates are Proposal records
+        if not isinstance(agent_template, dict):
+            agent_template = asdict(agent_template)
         
         # Create structured proposal data
         proposal_data = {
@@ -295,7 +303,11 @@ JSON array:"""
                 "type": "function"
             }]
             token_contract = self.w3.eth.contract(address=market_token, abi=balance_abi)
-            balance = token_contract.functions.balanceOf(self.address).call()
+            # Blocking RPCs run in threads so several agents can propose at once
+            balance, gas_price = await asyncio.gather(
+                asyncio.to_thread(token_contract.functions.balanceOf(self.address).call),
+                asyncio.to_thread(lambda: self.w3.eth.gas_price)
+            )
             print(f"  Agent balance: {balance}, required: {min_deposit} (scaled from {min_deposit})")
             
             if balance < min_deposit:
@@ -315,11 +327,11 @@ JSON array:"""
             tx = market_token_contract.functions.approve(self.market_address, min_deposit).build_transaction({
                 'from': self.address,
                 'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price,
+                'gasPrice': gas_price,
                 'nonce': approve_nonce,
             })
             signed_tx = self.account.sign_transaction(tx)
-            self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
             self.increment_nonce()  # Increment after successful send
             
             # Now deposit to market
@@ -341,12 +353,12 @@ JSON array:"""
             tx = market.functions.depositToMarket(self.address, market_id, min_deposit).build_transaction({
                 'from': self.address,
                 'gas': 200000,
-                'gasPrice': self.w3.eth.gas_price,
+                'gasPrice': gas_price,
                 'nonce': deposit_nonce,
             })
             signed_tx = self.account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+            receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash)
             self.increment_nonce()  # Increment after successful send
             
             if receipt['status'] != 1:
@@ -374,14 +386,14 @@ JSON array:"""
             tx = market.functions.createProposal(market_id, proposal_data).build_transaction({
                 'from': self.address,
                 'gas': 6000000,  # Increased gas limit - proposal creation needs ~3.7M
-                'gasPrice': self.w3.eth.gas_price,
+                'gasPrice': gas_price,
                 'nonce': proposal_nonce,
             })
             
             signed_tx = self.account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
             print(f"  Tx sent: {tx_hash.hex()}")
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash)
             self.increment_nonce()  # Increment after successful send
             
             print(f"  Tx receipt status: {receipt['status']}, gas used: {receipt['gasUsed']}")
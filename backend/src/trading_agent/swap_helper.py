@@ -1,7 +1,88 @@
 """Helper functions for encoding PoolSwapTest swap commands"""
-from eth_abi import encode
+from functools import lru_cache
+from typing import Final, List, NamedTuple, Sequence, Tuple
+
+from eth_abi.registry import registry
 from web3 import Web3
 
+# Encoders for the fixed swap(PoolKey,SwapParams,TestSettings,bytes) schema,
+# built once instead of parsing the type strings on every call
+_encode_pool_key_tuple = registry.get_encoder('(address,address,uint24,int24,address)')
+
+class PoolKey(NamedTuple):
+    """Uniswap v4 PoolKey struct, in ABI field order"""
+    currency0: str
+    currency1: str
+    fee: int
+    tickSpacing: int
+    hooks: str
+
+# Minimum swap output. Slippage is deliberately not enforced: we WANT prices
+# to move for market discovery, so any non-zero output is accepted
+AMOUNT_OUT_MINIMUM: Final[int] = 1
+
+# Function selector for swap(PoolKey,SwapParams,TestSettings,bytes)
+_SWAP_SELECTOR = bytes.fromhex('2229d0b4')
+
+# sqrtPriceLimitX96 indexed by zero_for_one
+_SQRT_LIMITS = (
+    1461446703485210103287273052203988822378723970341,  # TickMath.MAX_SQRT_PRICE - 1
+    4295128740,  # TickMath.MIN_SQRT_PRICE + 1
+)
+
+# Pre-packed 32-byte ABI words for the fixed-width swap fields
+_FALSE_WORD = bytes(32)
+_TRUE_WORD = bytes(31) + b'\x01'
+_BOOL_WORDS = (_FALSE_WORD, _TRUE_WORD)
+_SQRT_LIMIT_WORDS = tuple(limit.to_bytes(32, 'big') for limit in _SQRT_LIMITS)
+
+# amountSpecified is int256 and is sent negated, so amount_in may be at most 2**255
+_MASK256 = (1 << 256) - 1
+_MAX_AMOUNT_IN = 1 << 255
+
+# TestSettings struct (takeClaims=false, settleUsingBurn=false) never changes
+_TEST_SETTINGS_ENCODED = _FALSE_WORD + _FALSE_WORD
+
+# Byte offset of hook_data in swap(PoolKey,SwapParams,TestSettings,bytes) params:
+# PoolKey (5 words) + SwapParams (3 words) + TestSettings (2 words) + the offset word itself
+_HOOK_DATA_OFFSET = (11 * 32).to_bytes(32, 'big')
+
+def _as_pool_key(pool_key):
+    """Accept a PoolKey or a legacy pool key dict"""
+    return pool_key if isinstance(pool_key, PoolKey) else PoolKey(**pool_key)
+
+@lru_cache(maxsize=256)
+def _encode_pool_key(pool_key):
+    """ABI-encode a PoolKey
+
+    PoolKey is a static struct, so its encoding is the fixed 160-byte head of
+    the swap params and can be reused for every swap on the same pool.
+    """
+    return _encode_pool_key_tuple(pool_key)
+
+def _encode_swap_tail(zero_for_one, amount_in, hook_data):
+    """Pack SwapParams, TestSettings and hook_data: everything after the PoolKey head"""
+    if not 0 <= amount_in <= _MAX_AMOUNT_IN:
+        raise ValueError(f"amount_in out of range for int256 exact input: {amount_in}")
+
+    return b''.join((
+        # SwapParams struct
+        _BOOL_WORDS[zero_for_one],
+        ((-amount_in) & _MASK256).to_bytes(32, 'big'),  # Negative for exact input, two's complement
+        _SQRT_LIMIT_WORDS[zero_for_one],
+        _TEST_SETTINGS_ENCODED,
+        # hook_data: offset, length, then data right-padded to a word boundary
+        _HOOK_DATA_OFFSET,
+        len(hook_data).to_bytes(32, 'big'),
+        hook_data,
+        bytes(-len(hook_data) % 32)
+    ))
+
+@lru_cache(maxsize=64)
+def _checksum(address):
+    """EIP-55 checksum an address; callers pass it lowercased so casing variants share an entry"""
+    return Web3.to_checksum_address(address)
+
 def encode_pool_swap_test(
     pool_key,
     zero_for_one,
@@ -13,7 +94,7 @@ def encode_pool_swap_test(
     Encode a swap call for PoolSwapTest contract
 
     Args:
-        pool_key: dict with currency0, currency1, fee, tickSpacing, hooks
+        pool_key: PoolKey, or dict with currency0, currency1, fee, tickSpacing, hooks
         zero_for_one: bool, true if swapping token0 for token1
         amount_in: amount of input token
         amount_out_minimum: minimum amount of output token (ignored, we accept any output)
@@ -23,41 +104,27 @@ def encode_pool_swap_test(
         bytes: encoded function call data for PoolSwapTest.swap()
     """
 
-    # Function selector for swap(PoolKey,SwapParams,TestSettings,bytes)
-    selector = bytes.fromhex('2229d0b4')
-
-    # Encode PoolKey struct
-    pool_key_encoded = (
-        pool_key['currency0'],
-        pool_key['currency1'],
-        pool_key['fee'],
-        pool_key['tickSpacing'],
-        pool_key['hooks']
-    )
-
-    # Calculate sqrtPriceLimitX96 based on swap direction
-    if zero_for_one:
-        sqrt_price_limit = 4295128740  # TickMath.MIN_SQRT_PRICE + 1
-    else:
-        sqrt_price_limit = 1461446703485210103287273052203988822378723970341  # TickMath.MAX_SQRT_PRICE - 1
+    # Cached PoolKey head followed by the per-swap words
+    return _SWAP_SELECTOR + _encode_pool_key(_as_pool_key(pool_key)) + _encode_swap_tail(zero_for_one, amount_in, hook_data)
 
-    # Encode SwapParams struct
-    swap_params_encoded = (
-        zero_for_one,
-        -amount_in,  # Negative for exact input
-        sqrt_price_limit
-    )
+def encode_pool_swap_batch(
+    pool_key,
+    swaps: Sequence[Tuple[bool, int, bytes]]
+) -> List[bytes]:
+    """
+    Encode several PoolSwapTest swap calls against the same pool
 
-    # Encode TestSettings struct (takeClaims=false, settleUsingBurn=false)
-    test_settings_encoded = (False, False)
+    Args:
+        pool_key: PoolKey, or dict with currency0, currency1, fee, tickSpacing, hooks
+        swaps: (zero_for_one, amount_in, hook_data) per swap
 
-    # Encode all parameters
-    params = encode(
-        ['(address,address,uint24,int24,address)', '(bool,int256,uint160)', '(bool,bool)', 'bytes'],
-        [pool_key_encoded, swap_params_encoded, test_settings_encoded, hook_data]
-    )
+    Returns:
+        list: encoded function call data for each swap, in order
+    """
+    # Selector and PoolKey head are shared by every swap on the pool
+    prefix = _SWAP_SELECTOR + _encode_pool_key(_as_pool_key(pool_key))
 
-    return selector + params
+    return [prefix + _encode_swap_tail(zero_for_one, amount_in, hook_data) for zero_for_one, amount_in, hook_data in swaps]
 
 def build_swap_transaction(
     pool_key,
@@ -82,8 +149,8 @@ def build_swap_transaction(
     )
 
     return {
-        'to': Web3.to_checksum_address(router_address),
-        'data': '0x' + call_data.hex(),
+        'to': _checksum(router_address.lower()),
+        'data': call_data,  # Raw bytes; eth_account signs them without a hex round trip
         'value': 0  # No ETH needed for token swaps
     }
 
@@ -97,9 +164,6 @@ def calculate_amount_out_minimum(amount_in, is_selling_decision_token=True, slip
         slippage_bps: slippage in basis points (50 = 0.5%)
 
     Returns:
-        int: minimum output amount
+        int: minimum output amount (always AMOUNT_OUT_MINIMUM; slippage_bps is ignored by design)
     """
-
-    # We WANT prices to move for market discovery
-    # Accept any non-zero output
-    return 1
+    return AMOUNT_OUT_MINIMUM
@@ -7,12 +7,14 @@ from dotenv import load_dotenv
 try:
     from .swap_helper import (
         build_swap_transaction,
-        calculate_amount_out_minimum
+        AMOUNT_OUT_MINIMUM,
+        PoolKey
     )
 except ImportError:
     from src.trading_agent.swap_helper import (
         build_swap_transaction,
-        calculate_amount_out_minimum
+        AMOUNT_OUT_MINIMUM,
+        PoolKey
     )
 
 # Import Allora GAME agent for trading decisions
@@ -21,19 +23,34 @@ from src.allora_game_agent.allora_game_agent import get_trading_decision
 # Load environment variables
 load_dotenv()
 
+# ERC20 approve fragment shared by every token approval the agent sends
+APPROVE_ABI = [{
+    "inputs": [{"name": "spender", "type": "address"}, {"name": "amount", "type": "uint256"}],
+    "name": "approve",
+    "outputs": [{"name": "", "type": "bool"}],
+    "stateMutability": "nonpayable",
+    "type": "function"
+}]
+
 class TraderAgent:
     """Simple trader agent that trades on Quantum Markets proposals"""
 
-    def __init__(self, private_key, rpc_url, mock_usdc_address, market_address, router_address, pool_manager_address):
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        self.account = Account.from_key(private_key)
+    def __init__(self, private_key, rpc_url, mock_usdc_address, market_address, router_address, pool_manager_address, w3=None, account=None):
+        # Pass w3 to share one client (and connection pool) across agents, and
+        # account when the caller already derived it from private_key
+        self.w3 = w3 or Web3(Web3.HTTPProvider(rpc_url))
+        self.account = account or Account.from_key(private_key)
         self.mock_usdc_address = mock_usdc_address
         self.market_address = market_address
         self.router_address = router_address  # PoolSwapTest contract from .env
         self.pool_manager_address = pool_manager_address  # PoolManager contract
         self.funded = False
         self.nonce = None  # Track nonce to avoid conflicts
+        # Address-less ERC20 contract, built once; each approval sets 'to' to its token
+        self.erc20 = self.w3.eth.contract(abi=APPROVE_ABI)
         self.approved_to_pool_manager = set()  # Track which tokens are approved to PoolManager
+        self.approved_to_market = set()  # vUSD tokens with a max approval to the Market
+        self.claimed_proposals = set()  # Proposals claimed since the last deposit
         
     @property
     def address(self):
@@ -89,10 +106,10 @@ class TraderAgent:
         
         # Sign and send
         signed_tx = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
         
         # Wait for confirmation
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash)
         
         if receipt['status'] == 1:
             print(f"Trader {self.address} got tokens from faucet (tx: {receipt['transactionHash'].hex()})")
@@ -102,27 +119,17 @@ class TraderAgent:
     async def deposit_to_market(self, market_id, amount):
         """Deposit USDC to a market"""
         try:
-            # First approve Market to spend USDC
-            approve_abi = [{
-                "inputs": [{"name": "spender", "type": "address"}, {"name": "amount", "type": "uint256"}],
-                "name": "approve",
-                "outputs": [{"name": "", "type": "bool"}],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            }]
-            
-            mock_usdc = self.w3.eth.contract(address=self.mock_usdc_address, abi=approve_abi)
-            
-            # Approve using tracked nonce
+            # First approve Market to spend USDC, using tracked nonce
             approve_nonce = self.get_nonce()
-            tx = mock_usdc.functions.approve(self.market_address, amount).build_transaction({
+            tx = self.erc20.functions.approve(self.market_address, amount).build_transaction({
+                'to': self.mock_usdc_address,
                 'from': self.address,
                 'gas': 100000,
                 'gasPrice': self.w3.eth.gas_price,
                 'nonce': approve_nonce,
             })
             signed_tx = self.account.sign_transaction(tx)
-            self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
             self.increment_nonce()  # Increment after successful send
             
             # Deposit to market
@@ -147,9 +154,10 @@ class TraderAgent:
                 'nonce': deposit_nonce,
             })
             signed_tx = self.account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+            receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash)
             self.increment_nonce()  # Increment after successful send
+            self.claimed_proposals.clear()  # New collateral can be claimed again
             return receipt
         except Exception as e:
             # Reset nonce on error
@@ -157,7 +165,14 @@ class TraderAgent:
             raise e
     
     async def claim_vusd(self, proposal_id):
-        """Claim vUSD for a proposal"""
+        """Claim vUSD for a proposal
+
+        Skipped (returns None) if already claimed since the last deposit,
+        since the claim would mint nothing new.
+        """
+        if proposal_id in self.claimed_proposals:
+            return None
+        
         claim_abi = [{
             "inputs": [
                 {"name": "depositor", "type": "address"},
@@ -178,9 +193,11 @@ class TraderAgent:
             'nonce': claim_nonce,
         })
         signed_tx = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+        receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash)
         self.increment_nonce()
+        if receipt['status'] == 1:
+            self.claimed_proposals.add(proposal_id)
         return receipt
     
     async def get_proposal_data(self, proposal_id):
@@ -218,7 +235,7 @@ class TraderAgent:
         }]
         
         market = self.w3.eth.contract(address=self.market_address, abi=proposal_abi)
-        proposal = market.functions.proposals(proposal_id).call()
+        proposal = await asyncio.to_thread(market.functions.proposals(proposal_id).call)
         
         return {
             'id': proposal[0],
@@ -226,20 +243,8 @@ class TraderAgent:
             'vUSD': proposal[4],
             'yesToken': proposal[5],
             'noToken': proposal[6],
-            'yesPoolKey': {
-                'currency0': proposal[7][0],
-                'currency1': proposal[7][1],
-                'fee': proposal[7][2],
-                'tickSpacing': proposal[7][3],
-                'hooks': proposal[7][4]
-            },
-            'noPoolKey': {
-                'currency0': proposal[8][0],
-                'currency1': proposal[8][1],
-                'fee': proposal[8][2],
-                'tickSpacing': proposal[8][3],
-                'hooks': proposal[8][4]
-            }
+            'yesPoolKey': PoolKey(*proposal[7]),
+            'noPoolKey': PoolKey(*proposal[8])
         }
     
     async def get_proposal_tokens(self, proposal_id):
@@ -256,19 +261,11 @@ class TraderAgent:
         try:
             # Step 1: Approve token to PoolSwapTest (it calls transferFrom)
             if token_in not in self.approved_to_pool_manager:
-                approve_abi = [{
-                    "inputs": [{"name": "spender", "type": "address"}, {"name": "amount", "type": "uint256"}],
-                    "name": "approve",
-                    "outputs": [{"name": "", "type": "bool"}],
-                    "stateMutability": "nonpayable",
-                    "type": "function"
-                }]
-
-                token = self.w3.eth.contract(address=Web3.to_checksum_address(token_in), abi=approve_abi)
                 approve_nonce = self.get_nonce()
 
                 print(f"  Approving {token_in[:8]}... to PoolSwapTest...")
-                tx = token.functions.approve(self.router_address, 2**256 - 1).build_transaction({
+                tx = self.erc20.functions.approve(self.router_address, 2**256 - 1).build_transaction({
+                    'to': Web3.to_checksum_address(token_in),
                     'from': self.address,
                     'gas': 100000,
                     'gasPrice': self.w3.eth.gas_price,
@@ -276,8 +273,8 @@ class TraderAgent:
                 })
 
                 signed_tx = self.account.sign_transaction(tx)
-                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+                tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+                receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash)
                 self.increment_nonce()
 
                 if receipt['status'] == 1:
@@ -288,23 +285,16 @@ class TraderAgent:
                     return None
 
             # Determine if this is a zero_for_one swap
-            token0 = pool_key['currency0']
-            token1 = pool_key['currency1']
+            token0 = pool_key.currency0
+            token1 = pool_key.currency1
             zero_for_one = token_in.lower() == token0.lower()
 
-            # Calculate minimum output with slippage
-            amount_out_minimum = calculate_amount_out_minimum(
-                amount_in,
-                is_selling_decision_token,
-                slippage_bps=100  # 1% slippage
-            )
-
             # Build the swap transaction
             swap_tx = build_swap_transaction(
                 pool_key=pool_key,
                 zero_for_one=zero_for_one,
                 amount_in=amount_in,
-                amount_out_minimum=amount_out_minimum,
+                amount_out_minimum=AMOUNT_OUT_MINIMUM,
                 router_address=self.router_address
             )
 
@@ -319,8 +309,8 @@ class TraderAgent:
 
             # Sign and send transaction
             signed_tx = self.account.sign_transaction(swap_tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+            receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash)
             self.increment_nonce()
 
             print(f"  Swap tx: {receipt['transactionHash'].hex()}")
@@ -353,11 +343,33 @@ class TraderAgent:
             'nonce': mint_nonce,
         })
         signed_tx = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+        receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash)
         self.increment_nonce()
         return receipt
     
+    async def approve_vusd_to_market(self, vusd_address, gas_price=None):
+        """Give the Market a max vUSD allowance for mintYesNo, once per token
+
+        Returns True if an approval was sent, False if one already was.
+        """
+        if vusd_address in self.approved_to_market:
+            return False
+        
+        vusd_nonce = self.get_nonce()
+        tx = self.erc20.functions.approve(self.market_address, 2**256 - 1).build_transaction({
+            'to': Web3.to_checksum_address(vusd_address),
+            'from': self.address,
+            'gas': 100000,
+            'gasPrice': gas_price or self.w3.eth.gas_price,
+            'nonce': vusd_nonce,
+        })
+        signed_tx = self.account.sign_transaction(tx)
+        await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+        self.increment_nonce()
+        self.approved_to_market.add(vusd_address)
+        return True
+    
     async def trade(self, proposal_id, market_id):
         """Execute a trade on a proposal"""
         try:
@@ -384,26 +396,7 @@ class TraderAgent:
             tokens = await self.get_proposal_tokens(proposal_id)
 
             # Approve vUSD to Market contract for mintYesNo
-            vusd_address = tokens['vUSD']
-            approve_abi = [{
-                "inputs": [{"name": "spender", "type": "address"}, {"name": "amount", "type": "uint256"}],
-                "name": "approve",
-                "outputs": [{"name": "", "type": "bool"}],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            }]
-            
-            vusd_contract = self.w3.eth.contract(address=Web3.to_checksum_address(vusd_address), abi=approve_abi)
-            vusd_nonce = self.get_nonce()
-            tx = vusd_contract.functions.approve(self.market_address, 2**256 - 1).build_transaction({
-                'from': self.address,
-                'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': vusd_nonce,
-            })
-            signed_tx = self.account.sign_transaction(tx)
-            self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            self.increment_nonce()
+            await self.approve_vusd_to_market(tokens['vUSD'])
             
             # Get full proposal data with pool keys
             proposal_data = await self.get_proposal_data(proposal_id)
@@ -508,8 +501,8 @@ class TraderAgent:
                 'nonce': self.get_nonce(),
             })
             signed_tx = self.account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+            receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash)
             self.increment_nonce()
             print(f"Market {market_id} graduated successfully! (tx: {receipt['transactionHash'].hex()})")
             return receipt
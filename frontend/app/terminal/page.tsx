@@ -142,6 +142,13 @@ export default function TerminalPage() {
         }
       }
       
+      // Swarm output arrives batched - one terminal line per entry
+      if (data.type === 'swarm_log_batch' && data.lines) {
+        const timestamp = new Date().toLocaleTimeString();
+        const lines = data.lines.map((line: string) => `[${timestamp}] ${line}`);
+        setTerminalLogs(prev => [...prev.slice(-100), ...lines]);
+      }
+      
       // Handle swarm status changes
       if (data.type === 'swarm_launch') {
         if (data.status === 'completed' || data.status === 'error') {
@@ -6,12 +6,13 @@ Middleware for interacting with Zobeide
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 import asyncio
-import json
 import os
 import sys
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from web3 import Web3
@@ -19,13 +20,31 @@ from eth_account import Account
 from dotenv import load_dotenv
 import subprocess
 import logging
+import re
+import time
+import orjson
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Backend paths, resolved once at import
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent / "backend"
+BACKEND_CORE_DIR = BACKEND_DIR / "src" / "core"
+SWARM_SCRIPT = str(BACKEND_CORE_DIR / "start_swarm.py")
+
 # Add backend directory to path for imports
-backend_path = str(Path(__file__).parent.parent.parent / "backend")
+backend_path = str(BACKEND_DIR)
 sys.path.append(backend_path)
 
 # Import local modules with correct paths
@@ -33,7 +52,7 @@ from src.trading_agent.trader_agent import TraderAgent
 from src.proposal_agent.proposal_agent import ProposalAgent
 from src.allora_game_agent.allora_game_agent import get_trader_personality
 from src.cities.invisible_cities import INVISIBLE_CITIES
-from src.launchpad_agent.launchpad_agent import AgentTokenLauncher
+from src.launchpad_agent.launchpad_agent import AgentTokenLauncher, get_shared_web3
 
 # Load environment variables
 load_dotenv()
@@ -42,7 +61,8 @@ load_dotenv()
 app = FastAPI(
     title="Zobeide API",
     description="API for managing agentic futarchy on Virtuals Protocol",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS - use environment variable for production
@@ -61,43 +81,302 @@ class AppState:
         self.active_markets = {}
         self.active_traders = {}
         self.active_proposals = {}
+        # Per-market views of the same records so lookups skip the global scan
+        self.traders_by_market: Dict[int, Dict[str, dict]] = defaultdict(dict)
+        self.proposals_by_market: Dict[int, Dict[int, dict]] = defaultdict(dict)
+        self.trades_by_market: Dict[int, int] = defaultdict(int)
+        # (market_id, swarm pid) of the last market_update broadcast
+        self.last_market_update: Optional[Tuple[int, Optional[int]]] = None
         self.websocket_connections = []
         self.trading_tasks = {}
         self.swarm_processes = {}
 
 state = AppState()
 
+# Set whenever the latest market or its swarm changes; wakes broadcast_updates
+market_changed = asyncio.Event()
+
 # WebSocket manager for broadcasting
+
+# Clients offering this subprotocol get binary MessagePack frames instead of JSON text
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+def _msgpack_default(obj):
+    # orjson writes datetimes natively (same text as isoformat); match it
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+def encode_event(message: dict, binary: bool = False) -> dict:
+    """Build the ASGI websocket.send event for message
+
+    Messages may carry datetime values; both encoders emit them as ISO-8601.
+    """
+    if binary:
+        return {"type": "websocket.send", "bytes": msgpack.packb(message, use_bin_type=True, default=_msgpack_default)}
+    # Text frames: the frontend JSON.parses event.data as a string
+    return {"type": "websocket.send", "text": orjson.dumps(message).decode()}
+
+def now_ms() -> int:
+    """Epoch milliseconds for event timestamps; clients format them if needed"""
+    return time.time_ns() // 1_000_000
+
+def pre_encode(message: dict) -> Tuple[dict, Optional[dict]]:
+    """Encode a constant message once, in every format, for broadcast_raw"""
+    return encode_event(message), encode_event(message, binary=True) if msgpack is not None else None
+
+# Constant frames sent on every market creation
+SIGNING_EVENTS = pre_encode({
+    "type": "market_creation",
+    "status": "signing",
+    "message": "Signing transaction..."
+})
+
 class WebSocketManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(self, send_queue_size: int = 64):
+        # ws -> (outbound queue, writer task); each peer drains its own queue
+        self.active_connections: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
+        self.msgpack_connections: Set[WebSocket] = set()
+        # market_id -> clients subscribed to it, and the reverse for cleanup;
+        # clients that never subscribe receive every market's events
+        self.subscriptions: Dict[int, Set[WebSocket]] = defaultdict(set)
+        self.subscribed_markets: Dict[WebSocket, Set[int]] = {}
+        self.send_queue_size = send_queue_size
 
     async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+        binary = msgpack is not None and MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+        await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if binary else None)
+        if binary:
+            self.msgpack_connections.add(websocket)
+        queue = asyncio.Queue(maxsize=self.send_queue_size)
+        writer = asyncio.create_task(self._writer(websocket, queue))
+        self.active_connections[websocket] = (queue, writer)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        entry = self.active_connections.pop(websocket, None)
+        if entry is None:
+            return
+        self.msgpack_connections.discard(websocket)
+        for market_id in self.subscribed_markets.pop(websocket, ()):
+            subscribers = self.subscriptions[market_id]
+            subscribers.discard(websocket)
+            if not subscribers:
+                del self.subscriptions[market_id]
+        writer = entry[1]
+        if writer is not asyncio.current_task():
+            writer.cancel()
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain one connection's queue so a slow peer only delays itself"""
+        try:
+            while True:
+                event = await queue.get()
+                await websocket.send(event)
+        except Exception:
+            self.disconnect(websocket)
+
+    async def _close(self, websocket: WebSocket):
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+    async def close_all(self, timeout: float):
+        """Disconnect and close every client concurrently, waiting at most timeout seconds"""
+        connections = list(self.active_connections)
+        for connection in connections:
+            self.disconnect(connection)
+        if connections:
+            try:
+                await asyncio.wait_for(asyncio.gather(*(self._close(c) for c in connections)), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Timed out closing {len(connections)} WebSocket connections")
+
+    def set_encoding(self, websocket: WebSocket, encoding: str) -> str:
+        """Switch a client between "json" and "msgpack" frames; returns the one in effect"""
+        if encoding == "msgpack" and msgpack is not None:
+            self.msgpack_connections.add(websocket)
+            return "msgpack"
+        self.msgpack_connections.discard(websocket)
+        return "json"
+
+    def subscribe(self, websocket: WebSocket, market_id: int):
+        """Limit websocket's market-scoped events to the markets it subscribes to"""
+        if websocket in self.active_connections:
+            self.subscriptions[market_id].add(websocket)
+            self.subscribed_markets.setdefault(websocket, set()).add(market_id)
+
+    async def send_personal(self, websocket: WebSocket, message: dict):
+        """Send message to one client in the format it negotiated"""
+        await websocket.send(encode_event(message, websocket in self.msgpack_connections))
+
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
+        self.broadcast_message_nowait(message)
+
+    async def broadcast_raw(self, event: dict, binary_event: Optional[dict] = None):
+        """Broadcast already-encoded send events (see pre_encode)"""
+        self.broadcast_nowait(event, binary_event)
+
+    def broadcast_message_nowait(self, message: dict, snapshot: bool = False):
+        """Encode message once per format and queue it for every client
+
+        Events for one market (those with a market_id, except market_creation
+        announcements) skip clients subscribed only to other markets.
+        """
+        if self.active_connections:
+            event = encode_event(message)
+            binary_event = encode_event(message, binary=True) if self.msgpack_connections else None
+            market_id = message.get("market_id") if message.get("type") != "market_creation" else None
+            self.broadcast_nowait(event, binary_event, snapshot, market_id)
+
+    def broadcast_nowait(self, event: dict, binary_event: Optional[dict] = None, snapshot: bool = False, market_id: Optional[int] = None):
+        """Queue already-encoded send events for every client without awaiting
+
+        Each connection's writer task does the actual send, so fan-out costs
+        one put_nowait per client and never yields to the event loop.
+        Snapshot events (full state, superseded by the next one) are skipped
+        for a peer whose queue is full rather than dropping the peer.
+        """
         if self.active_connections:
-            message_str = json.dumps(message)
-            disconnected = []
-            for connection in self.active_connections:
+            overflowed = []
+            scoped = market_id is not None and self.subscribed_markets
+            for connection, (queue, _) in self.active_connections.items():
+                if scoped and connection in self.subscribed_markets and connection not in self.subscriptions.get(market_id, ()):
+                    continue
                 try:
-                    await connection.send_text(message_str)
-                except:
-                    disconnected.append(connection)
+                    queue.put_nowait(binary_event if connection in self.msgpack_connections else event)
+                except asyncio.QueueFull:
+                    if not snapshot:
+                        overflowed.append(connection)
             
-            # Remove disconnected clients
-            for conn in disconnected:
-                self.active_connections.remove(conn)
+            # Drop peers that fell too far behind instead of stalling the fan-out
+            for conn in overflowed:
+                self.disconnect(conn)
+                asyncio.create_task(self._close(conn))
 
 ws_manager = WebSocketManager()
 
+CREATE_MARKET_ABI = [{
+    "inputs": [
+        {"name": "creator", "type": "address"},
+        {"name": "marketToken", "type": "address"},
+        {"name": "resolver", "type": "address"},
+        {"name": "minDeposit", "type": "uint256"},
+        {"name": "deadline", "type": "uint256"},
+        {"name": "title", "type": "string"}
+    ],
+    "name": "createMarket",
+    "outputs": [{"name": "marketId", "type": "uint256"}],
+    "stateMutability": "nonpayable",
+    "type": "function"
+}]
+
+# (w3, account, market contract) for market creation, built once so the
+# HTTP session and its keep-alive connections are reused across requests
+_market_chain: Optional[Tuple[Web3, Any, Any]] = None
+
+# Shared launcher; building one per request re-created the Web3 client and contracts
+_launcher: Optional[AgentTokenLauncher] = None
+
+def get_web3() -> Web3:
+    """Return the Web3 client shared by market creation and the launcher"""
+    return get_shared_web3()
+
+def get_launcher() -> AgentTokenLauncher:
+    """Return the shared AgentTokenLauncher, creating it on first use"""
+    global _launcher
+    if _launcher is None:
+        _launcher = AgentTokenLauncher(w3=get_web3())
+    return _launcher
+
+def get_market_chain() -> Tuple[Web3, Any, Any]:
+    """Return the shared (w3, account, market_contract), creating them on first use"""
+    global _market_chain
+    if _market_chain is None:
+        w3 = get_web3()
+        account = Account.from_key(os.getenv("PRIVATE_KEY"))
+        market_contract = w3.eth.contract(address=os.getenv("MARKET_ADDRESS"), abi=CREATE_MARKET_ABI)
+        _market_chain = (w3, account, market_contract)
+    return _market_chain
+
+async def get_winning_proposal(market_id: int) -> Optional[Dict]:
+    """Winning proposal for a market, looked up off the event loop
+
+    Caching is left to the launcher's own WINNING_PROPOSAL_TTL cache.
+    """
+    return await asyncio.to_thread(get_launcher().get_winning_proposal, market_id)
+
+# Single pass over each swarm stdout line; the named group that matched
+# (match.lastgroup) selects how run_swarm_with_updates handles it
+SWARM_LOG_PATTERN = re.compile(
+    r"(?P<trader>Created trader .*?(?P<trader_addr>0x.*?)\.\.\.(?:.*?→\s*(?P<personality>.*))?)"
+    r"|(?P<proposal>created proposal ID\s+(?P<proposal_id>\d+)\s*$)"
+    r"|(?P<trade>Trade executed|(?i:trade completed))"
+    r"|(?P<marketmax>(?:MarketMax|TWAP).*?Proposal\s+(?P<mm_proposal>\S+).*?price\s+(?P<mm_price>\S+))"
+)
+
+# Market id handed over to start_swarm.py and recovered on restart
+LATEST_MARKET_FILE = BACKEND_CORE_DIR / "latest_market.txt"
+
+# (st_mtime_ns, market_id) of the last read of LATEST_MARKET_FILE
+_market_file_cache: Optional[Tuple[int, int]] = None
+
+def _read_market_file(cache: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+    # stat and read in one worker hop; int() accepts bytes and ignores
+    # surrounding whitespace, so no text decode or strip is needed
+    try:
+        mtime_ns = os.stat(LATEST_MARKET_FILE).st_mtime_ns
+        if cache is not None and cache[0] == mtime_ns:
+            return cache
+        return mtime_ns, int(LATEST_MARKET_FILE.read_bytes())
+    except FileNotFoundError:
+        return None
+
+async def read_latest_market_id() -> Optional[int]:
+    """Market id from latest_market.txt, re-read only when its mtime changes
+
+    Returns None if the file doesn't exist; raises ValueError if it doesn't
+    hold an integer.
+    """
+    global _market_file_cache
+    cache = await asyncio.to_thread(_read_market_file, _market_file_cache)
+    if cache is None:
+        return None
+    _market_file_cache = cache
+    return cache[1]
+
+def _write_market_file(market_id: int):
+    # Write then rename so readers never observe a truncated file
+    LATEST_MARKET_FILE.parent.mkdir(exist_ok=True)
+    tmp_file = LATEST_MARKET_FILE.with_suffix(".tmp")
+    tmp_file.write_text(str(market_id))
+    os.replace(tmp_file, LATEST_MARKET_FILE)
+
+async def write_latest_market_id(market_id: int):
+    """Persist market_id to latest_market.txt for the orchestrator"""
+    global _market_file_cache
+    await asyncio.to_thread(_write_market_file, market_id)
+    _market_file_cache = None
+    market_changed.set()
+
+# swarm_log_batch frames go out every SWARM_LOG_FLUSH_INTERVAL seconds or
+# once SWARM_LOG_BATCH_SIZE lines are buffered, whichever comes first
+SWARM_LOG_FLUSH_INTERVAL = 0.02
+SWARM_LOG_BATCH_SIZE = 32
+
+# StreamReader buffer for swarm stdout; a longer line (e.g. a traceback with a
+# large revert payload) would otherwise abort the read loop at the 64 KiB default
+SWARM_LOG_LINE_LIMIT = 1 << 20
+
+# Placeholder deadline for markets whose real deadline isn't known here
+DEFAULT_DEADLINE_SECONDS = 600
+
+def default_deadline() -> int:
+    return int(time.time()) + DEFAULT_DEADLINE_SECONDS
+
 # Pydantic models for request/response
 class CreateMarketRequest(BaseModel):
     title: str = "AI Agent Launch Market"
@@ -169,27 +448,40 @@ class HealthResponse(BaseModel):
 
 # API Endpoints
 
-@app.get("/", response_model=HealthResponse)
+# The hot polling endpoints build their payloads directly and return them as
+# ORJSONResponse, skipping response-model validation; `responses` keeps the
+# documented schema in OpenAPI
+
+_HEALTH_CONST = {"status": "healthy", "version": "1.0.0"}
+
+# (epoch second, ISO string) so probes within the same second share one format
+_iso_cache: Tuple[int, str] = (0, "")
+
+def _fast_iso() -> str:
+    """Current local time as ISO-8601, at one-second resolution"""
+    global _iso_cache
+    now = int(time.time())
+    if _iso_cache[0] != now:
+        _iso_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _iso_cache[1]
+
+def health_payload() -> ORJSONResponse:
+    return ORJSONResponse({
+        **_HEALTH_CONST,
+        "timestamp": _fast_iso(),
+        "active_markets": len(state.active_markets),
+        "active_connections": len(ws_manager.active_connections)
+    })
+
+@app.get("/", responses={200: {"model": HealthResponse}})
 async def root():
     """Health check and status endpoint"""
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now().isoformat(),
-        version="1.0.0",
-        active_markets=len(state.active_markets),
-        active_connections=len(ws_manager.active_connections)
-    )
+    return health_payload()
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """Health check endpoint for deployment monitoring"""
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now().isoformat(),
-        version="1.0.0",
-        active_markets=len(state.active_markets),
-        active_connections=len(ws_manager.active_connections)
-    )
+    return health_payload()
 
 @app.post("/api/markets/create", response_model=CreateMarketResponse)
 async def create_market(request: CreateMarketRequest, background_tasks: BackgroundTasks):
@@ -204,71 +496,56 @@ async def create_market(request: CreateMarketRequest, background_tasks: Backgrou
                     "message": f"Creating market: {request.title}"
                 })
 
-                # Initialize web3 and account
-                w3 = Web3(Web3.HTTPProvider(os.getenv("RPC_URL", "https://sepolia.base.org")))
-                account = Account.from_key(os.getenv("PRIVATE_KEY"))
+                # Shared web3 client, account and market contract
+                w3, account, market_contract = get_market_chain()
 
                 # Market creation logic
-                market_address = os.getenv("MARKET_ADDRESS")
                 mock_usdc_address = os.getenv("MOCK_USDC_ADDRESS", "0xaF26B96096D3a989D2f31ffbdd686Fa23cbE9b42")
 
                 # Calculate deadline
                 deadline = int((datetime.now() + timedelta(minutes=request.duration_minutes)).timestamp())
 
-                # Create market contract instance
-                create_market_abi = [{
-                    "inputs": [
-                        {"name": "creator", "type": "address"},
-                        {"name": "marketToken", "type": "address"},
-                        {"name": "resolver", "type": "address"},
-                        {"name": "minDeposit", "type": "uint256"},
-                        {"name": "deadline", "type": "uint256"},
-                        {"name": "title", "type": "string"}
-                    ],
-                    "name": "createMarket",
-                    "outputs": [{"name": "marketId", "type": "uint256"}],
-                    "stateMutability": "nonpayable",
-                    "type": "function"
-                }]
-
-                market_contract = w3.eth.contract(address=market_address, abi=create_market_abi)
-
                 # Build and send transaction
                 resolver = request.resolver_address or account.address
                 min_deposit = int(request.min_deposit * 10**18)
 
-                await ws_manager.broadcast({
-                    "type": "market_creation",
-                    "status": "signing",
-                    "message": "Signing transaction..."
-                })
+                await ws_manager.broadcast_raw(*SIGNING_EVENTS)
+
+                # web3 here is synchronous; run its RPC calls in worker threads
+                # so they don't block the event loop serving REST and WebSockets
+                gas_price, nonce = await asyncio.gather(
+                    asyncio.to_thread(lambda: w3.eth.gas_price),
+                    asyncio.to_thread(w3.eth.get_transaction_count, account.address)
+                )
 
-                tx = market_contract.functions.createMarket(
+                create_call = market_contract.functions.createMarket(
                     account.address,
                     mock_usdc_address,
                     resolver,
                     min_deposit,
                     deadline,
                     request.title
-                ).build_transaction({
+                )
+                tx = await asyncio.to_thread(create_call.build_transaction, {
                     'from': account.address,
                     'gas': 500000,
-                    'gasPrice': w3.eth.gas_price,
-                    'nonce': w3.eth.get_transaction_count(account.address),
+                    'gasPrice': gas_price,
+                    'nonce': nonce,
                 })
 
                 signed_tx = account.sign_transaction(tx)
-                tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                tx_hash = await asyncio.to_thread(w3.eth.send_raw_transaction, signed_tx.raw_transaction)
+                tx_hash_hex = tx_hash.hex()
 
                 await ws_manager.broadcast({
                     "type": "market_creation",
                     "status": "pending",
-                    "message": f"Transaction sent: {tx_hash.hex()}",
-                    "tx_hash": tx_hash.hex()
+                    "message": f"Transaction sent: {tx_hash_hex}",
+                    "tx_hash": tx_hash_hex
                 })
 
                 # Wait for receipt
-                receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+                receipt = await asyncio.to_thread(w3.eth.wait_for_transaction_receipt, tx_hash)
 
                 if receipt['status'] != 1:
                     raise Exception("Market creation transaction failed")
@@ -276,7 +553,7 @@ async def create_market(request: CreateMarketRequest, background_tasks: Backgrou
                 # Extract market ID from logs
                 if receipt['logs']:
                     # First topic is the event signature, second is the indexed marketId
-                    market_id = int(receipt['logs'][0]['topics'][1].hex(), 16)
+                    market_id = int.from_bytes(receipt['logs'][0]['topics'][1], "big")
                 else:
                     raise Exception("No market ID in transaction logs")
 
@@ -286,21 +563,18 @@ async def create_market(request: CreateMarketRequest, background_tasks: Backgrou
                     "deadline": deadline,
                     "created_at": datetime.now().isoformat(),
                     "is_graduated": False,
-                    "tx_hash": tx_hash.hex()
+                    "tx_hash": tx_hash_hex
                 }
 
                 # Save to file for orchestrator compatibility
-                market_file = Path(__file__).parent.parent.parent / "backend" / "src" / "core" / "latest_market.txt"
-                market_file.parent.mkdir(exist_ok=True)
-                with open(market_file, "w") as f:
-                    f.write(str(market_id))
+                await write_latest_market_id(market_id)
 
                 await ws_manager.broadcast({
                     "type": "market_creation",
                     "status": "completed",
                     "market_id": market_id,
                     "message": f"Market #{market_id} created successfully!",
-                    "tx_hash": tx_hash.hex()
+                    "tx_hash": tx_hash_hex
                 })
 
                 logger.info(f"Market {market_id} created successfully")
@@ -337,8 +611,7 @@ async def get_market(market_id: int):
 
     # Check if market is graduated
     try:
-        launcher = AgentTokenLauncher()
-        winning_proposal = launcher.get_winning_proposal(market_id)
+        winning_proposal = await get_winning_proposal(market_id)
         is_graduated = winning_proposal is not None
         winning_id = winning_proposal['id'] if winning_proposal else None
     except:
@@ -358,8 +631,8 @@ async def get_market(market_id: int):
 async def get_market_stats(market_id: int):
     """Get comprehensive stats for a specific market including traders and proposals"""
     # Get trader and proposal counts from state
-    traders_count = len([t for t_id, t in state.active_traders.items() if t.get("market_id") == market_id])
-    proposals_count = len([p_id for p_id, p in state.active_proposals.items() if p["market_id"] == market_id])
+    traders_count = len(state.traders_by_market.get(market_id, {}))
+    proposals_count = len(state.proposals_by_market.get(market_id, {}))
     
     # Check if swarm is running
     is_running = market_id in state.swarm_processes
@@ -369,15 +642,16 @@ async def get_market_stats(market_id: int):
     if market_id in state.active_markets:
         market = state.active_markets[market_id]
         title = market.get("title", "AI Agent Launch Market")
-        deadline = market.get("deadline", int((datetime.now() + timedelta(minutes=10)).timestamp()))
+        deadline = market.get("deadline")
+        if deadline is None:
+            deadline = default_deadline()
     else:
         title = "AI Agent Launch Market"
-        deadline = int((datetime.now() + timedelta(minutes=10)).timestamp())
+        deadline = default_deadline()
     
     # Check if market is graduated
     try:
-        launcher = AgentTokenLauncher()
-        winning_proposal = launcher.get_winning_proposal(market_id)
+        winning_proposal = await get_winning_proposal(market_id)
         is_graduated = winning_proposal is not None
         winning_id = winning_proposal['id'] if winning_proposal else None
     except:
@@ -402,40 +676,38 @@ async def list_markets():
     markets = []
     
     # Read the latest market ID from file (the REAL one)
-    market_file = Path(__file__).parent.parent.parent / "backend" / "src" / "core" / "latest_market.txt"
-    if market_file.exists():
-        with open(market_file, "r") as f:
-            try:
-                market_id = int(f.read().strip())
-                
-                # Get trader and proposal counts from state
-                traders_count = len([t for t_id, t in state.active_traders.items() if t.get("market_id") == market_id])
-                proposals_count = len([p_id for p_id, p in state.active_proposals.items() if p["market_id"] == market_id])
-                
-                # For now, just return this one real market
-                # In production, you'd query the blockchain for all markets
-                market_info = {
-                    "market_id": market_id,
-                    "title": "AI Agent Launch Market",
-                    "deadline": int((datetime.now() + timedelta(minutes=10)).timestamp()),
-                    "is_graduated": False,
-                    "winning_proposal": None,
-                    "total_volume": None,
-                    "traders_count": traders_count,
-                    "proposals_count": proposals_count
-                }
-                
-                # Also include these in a MarketInfo compatible format
-                markets.append(MarketInfo(
-                    market_id=market_id,
-                    title="AI Agent Launch Market",
-                    deadline=int((datetime.now() + timedelta(minutes=10)).timestamp()),
-                    is_graduated=False,
-                    winning_proposal=None,
-                    total_volume=None
-                ))
-            except Exception as e:
-                logger.warning(f"Could not read market file: {e}")
+    try:
+        market_id = await read_latest_market_id()
+        if market_id is not None:
+            # Get trader and proposal counts from state
+            traders_count = len(state.traders_by_market.get(market_id, {}))
+            proposals_count = len(state.proposals_by_market.get(market_id, {}))
+            
+            # For now, just return this one real market
+            # In production, you'd query the blockchain for all markets
+            deadline = default_deadline()
+            market_info = {
+                "market_id": market_id,
+                "title": "AI Agent Launch Market",
+                "deadline": deadline,
+                "is_graduated": False,
+                "winning_proposal": None,
+                "total_volume": None,
+                "traders_count": traders_count,
+                "proposals_count": proposals_count
+            }
+            
+            # Also include these in a MarketInfo compatible format
+            markets.append(MarketInfo(
+                market_id=market_id,
+                title="AI Agent Launch Market",
+                deadline=deadline,
+                is_graduated=False,
+                winning_proposal=None,
+                total_volume=None
+            ))
+    except Exception as e:
+        logger.warning(f"Could not read market file: {e}")
     
     return markets
 
@@ -445,11 +717,8 @@ async def launch_swarm(request: LaunchSwarmRequest, background_tasks: Background
     try:
         # Get market ID
         if request.market_id is None:
-            market_file = Path(__file__).parent.parent.parent / "backend" / "src" / "core" / "latest_market.txt"
-            if market_file.exists():
-                with open(market_file, 'r') as f:
-                    market_id = int(f.read().strip())
-            else:
+            market_id = await read_latest_market_id()
+            if market_id is None:
                 raise HTTPException(status_code=400, detail="No market ID provided and no latest market found")
         else:
             market_id = request.market_id
@@ -458,6 +727,7 @@ async def launch_swarm(request: LaunchSwarmRequest, background_tasks: Background
             raise HTTPException(status_code=400, detail="Swarm already running for this market")
 
         async def run_swarm_with_updates():
+            log_flusher = None
             try:
                 # Broadcast start
                 await ws_manager.broadcast({
@@ -472,87 +742,104 @@ async def launch_swarm(request: LaunchSwarmRequest, background_tasks: Background
                 env["NUM_TRADERS"] = str(request.num_traders)
                 env["NUM_PROPOSAL_AGENTS"] = str(request.num_proposal_agents)
 
-                # Path to start_swarm.py
-                swarm_script = Path(__file__).parent.parent.parent / "backend" / "src" / "core" / "start_swarm.py"
-
                 # Run as subprocess to capture output - UNBUFFERED FOR REAL-TIME STREAMING
                 process = await asyncio.create_subprocess_exec(
-                    sys.executable, "-u", str(swarm_script),  # -u flag forces unbuffered stdout
+                    sys.executable, "-u", SWARM_SCRIPT,  # -u flag forces unbuffered stdout
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.STDOUT,
-                    env=env
+                    env=env,
+                    limit=SWARM_LOG_LINE_LIMIT
                 )
 
                 state.swarm_processes[market_id] = process
+                market_changed.set()
 
-                # Stream output to WebSocket
-                async for line in process.stdout:
-                    message = line.decode().strip()
-                    if message:
+                # Raw log lines go out in batches instead of one frame per line
+                log_buffer = []
+
+                async def flush_logs():
+                    if log_buffer:
+                        lines = log_buffer.copy()
+                        log_buffer.clear()
                         await ws_manager.broadcast({
-                            "type": "swarm_log",
+                            "type": "swarm_log_batch",
                             "market_id": market_id,
-                            "message": message,
-                            "timestamp": datetime.now().isoformat()
+                            "lines": lines,
+                            "timestamp_ms": now_ms()
                         })
+
+                async def flush_logs_periodically():
+                    while True:
+                        await asyncio.sleep(SWARM_LOG_FLUSH_INTERVAL)
+                        await flush_logs()
+
+                log_flusher = asyncio.create_task(flush_logs_periodically())
+
+                # Stream output to WebSocket
+                async for line in process.stdout:
+                    # Every non-empty line is broadcast as text, so it is decoded
+                    # once here; undecodable bytes must not end the stream
+                    message = line.decode("utf-8", "replace").strip()
+                    if message:
+                        log_buffer.append(message)
                         
                         # Parse special messages and update state
-                        if "Created trader" in message:
-                            # Extract trader address from log: "Created trader 0x1234... → Name (Type)"
-                            if "..." in message:
-                                addr_start = message.find("0x")
-                                if addr_start != -1:
-                                    addr_end = message.find("...", addr_start)
-                                    if addr_end != -1:
-                                        trader_addr = message[addr_start:addr_end]
-                                        # Extract personality info
-                                        arrow_idx = message.find("→")
-                                        if arrow_idx != -1:
-                                            personality_info = message[arrow_idx+1:].strip()
-                                        else:
-                                            personality_info = "Unknown"
-                                        
-                                        # Add to active traders
-                                        trader_id = f"{market_id}_{trader_addr}"
-                                        state.active_traders[trader_id] = {
-                                            "market_id": market_id,
-                                            "address": trader_addr,
-                                            "personality": personality_info,
-                                            "balance": 0,
-                                            "trades": 0,
-                                            "created_at": datetime.now().isoformat()
-                                        }
-                                        logger.info(f"Added trader {trader_addr} to market {market_id}")
+                        match = SWARM_LOG_PATTERN.search(message)
+                        kind = match.lastgroup if match else None
+
+                        # Events are sent right away, so flush the lines before them
+                        # to keep the terminal in order; otherwise batch by size
+                        if kind in ("proposal", "trade", "marketmax") or len(log_buffer) >= SWARM_LOG_BATCH_SIZE:
+                            await flush_logs()
+
+                        if kind == "trader":
+                            # "Created trader 0x1234... → Name (Type)"
+                            trader_addr = match["trader_addr"]
+                            # Only a handful of distinct labels recur across every trader
+                            personality = match["personality"]
+                            personality_info = sys.intern(personality) if personality else "Unknown"
+
+                            # Add to active traders
+                            trader_id = f"{market_id}_{trader_addr}"
+                            trader = {
+                                "market_id": market_id,
+                                "address": trader_addr,
+                                "personality": personality_info,
+                                "balance": 0,
+                                "trades": 0,
+                                "created_at": datetime.now().isoformat()
+                            }
+                            state.active_traders[trader_id] = trader
+                            state.traders_by_market[market_id][trader_addr] = trader
+                            logger.info(f"Added trader {trader_addr} to market {market_id}")
                         
-                        elif "created proposal ID" in message:
-                            # Extract proposal ID from log: "ProposalAgent X created proposal ID Y"
-                            try:
-                                parts = message.split("proposal ID")
-                                if len(parts) > 1:
-                                    proposal_id = int(parts[1].strip())
-                                    # Add to active proposals
-                                    state.active_proposals[proposal_id] = {
-                                        "market_id": market_id,
-                                        "id": proposal_id,
-                                        "created_at": datetime.now().isoformat()
-                                    }
-                                    logger.info(f"Added proposal {proposal_id} to market {market_id}")
-                                    
-                                    await ws_manager.broadcast({
-                                        "type": "proposal_created",
-                                        "market_id": market_id,
-                                        "proposal_id": proposal_id,
-                                        "message": message
-                                    })
-                            except (ValueError, IndexError) as e:
-                                logger.warning(f"Could not parse proposal ID from: {message}")
+                        elif kind == "proposal":
+                            # "ProposalAgent X created proposal ID Y"
+                            proposal_id = int(match["proposal_id"])
+                            # Add to active proposals
+                            proposal = {
+                                "market_id": market_id,
+                                "id": proposal_id,
+                                "created_at": datetime.now().isoformat()
+                            }
+                            state.active_proposals[proposal_id] = proposal
+                            state.proposals_by_market[market_id][proposal_id] = proposal
+                            logger.info(f"Added proposal {proposal_id} to market {market_id}")
+                            
+                            await ws_manager.broadcast({
+                                "type": "proposal_created",
+                                "market_id": market_id,
+                                "proposal_id": proposal_id,
+                                "message": message
+                            })
                         
-                        elif "Trade executed" in message or "trade completed" in message.lower():
+                        elif kind == "trade":
                             # Update trade count for traders
-                            for trader_id, trader_data in state.active_traders.items():
-                                if trader_data.get("market_id") == market_id:
-                                    trader_data["trades"] = trader_data.get("trades", 0) + 1
-                                    break  # Just increment for one trader for now
+                            # Just increment for one trader for now
+                            trader_data = next(iter(state.traders_by_market.get(market_id, {}).values()), None)
+                            if trader_data is not None:
+                                trader_data["trades"] = trader_data.get("trades", 0) + 1
+                                state.trades_by_market[market_id] += 1
                             
                             await ws_manager.broadcast({
                                 "type": "trade_executed",
@@ -560,45 +847,36 @@ async def launch_swarm(request: LaunchSwarmRequest, background_tasks: Background
                                 "message": message
                             })
                         
-                        elif "MarketMax" in message or "TWAP" in message:
-                            # Parse MarketMax/TWAP updates: "MarketMax updated: Proposal X with price Y"
-                            if "Proposal" in message and "price" in message:
-                                try:
-                                    # Extract proposal ID
-                                    prop_start = message.find("Proposal") + 9
-                                    prop_end = message.find(" ", prop_start)
-                                    if prop_end == -1:
-                                        prop_end = message.find("with", prop_start)
-                                    proposal_id = int(message[prop_start:prop_end].strip())
-                                    
-                                    # Extract price
-                                    price_start = message.find("price") + 6
-                                    price_str = message[price_start:].strip()
-                                    # Remove any trailing text
-                                    price_parts = price_str.split()[0]
-                                    price = float(price_parts)
-                                    
-                                    # Update market state
-                                    if market_id in state.active_markets:
-                                        state.active_markets[market_id]["leading_proposal"] = proposal_id
-                                        state.active_markets[market_id]["leading_price"] = price
-                                    else:
-                                        state.active_markets[market_id] = {
-                                            "leading_proposal": proposal_id,
-                                            "leading_price": price
-                                        }
-                                    
-                                    logger.info(f"MarketMax updated: Proposal {proposal_id} at price {price}")
-                                    
-                                    await ws_manager.broadcast({
-                                        "type": "marketmax_update",
-                                        "market_id": market_id,
-                                        "proposal_id": proposal_id,
-                                        "price": price,
-                                        "message": message
-                                    })
-                                except (ValueError, IndexError) as e:
-                                    logger.warning(f"Could not parse MarketMax from: {message}")
+                        elif kind == "marketmax":
+                            # "MarketMax updated: Proposal X with price Y"
+                            try:
+                                proposal_id = int(match["mm_proposal"])
+                                price = float(match["mm_price"])
+                                
+                                # Update market state
+                                if market_id in state.active_markets:
+                                    state.active_markets[market_id]["leading_proposal"] = proposal_id
+                                    state.active_markets[market_id]["leading_price"] = price
+                                else:
+                                    state.active_markets[market_id] = {
+                                        "leading_proposal": proposal_id,
+                                        "leading_price": price
+                                    }
+                                
+                                logger.info(f"MarketMax updated: Proposal {proposal_id} at price {price}")
+                                
+                                await ws_manager.broadcast({
+                                    "type": "marketmax_update",
+                                    "market_id": market_id,
+                                    "proposal_id": proposal_id,
+                                    "price": price,
+                                    "message": message
+                                })
+                            except ValueError:
+                                logger.warning(f"Could not parse MarketMax from: {message}")
+
+                log_flusher.cancel()
+                await flush_logs()
 
                 # Wait for process to complete
                 await process.wait()
@@ -627,8 +905,11 @@ async def launch_swarm(request: LaunchSwarmRequest, background_tasks: Background
                     "message": str(e)
                 })
             finally:
+                if log_flusher is not None:
+                    log_flusher.cancel()
                 if market_id in state.swarm_processes:
                     del state.swarm_processes[market_id]
+                    market_changed.set()
 
         background_tasks.add_task(run_swarm_with_updates)
 
@@ -645,17 +926,17 @@ async def launch_swarm(request: LaunchSwarmRequest, background_tasks: Background
         logger.error(f"Swarm launch error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/swarm/status/{market_id}", response_model=SwarmStatus)
+@app.get("/api/swarm/status/{market_id}", responses={200: {"model": SwarmStatus}})
 async def get_swarm_status(market_id: int):
     """Get status of trading swarm for a market"""
     is_running = market_id in state.swarm_processes
     process_id = str(state.swarm_processes[market_id].pid) if is_running else None
 
     # Get trader count
-    traders = [t for t_id, t in state.active_traders.items() if t.get("market_id") == market_id]
+    traders_count = len(state.traders_by_market.get(market_id, {}))
 
     # Get proposals
-    proposals = [p_id for p_id, p in state.active_proposals.items() if p["market_id"] == market_id]
+    proposals = list(state.proposals_by_market.get(market_id, {}))
 
     # Try to get leading proposal from state
     leading_proposal = None
@@ -665,16 +946,25 @@ async def get_swarm_status(market_id: int):
         leading_proposal = market.get("leading_proposal")
         leading_price = market.get("leading_price")
 
-    return SwarmStatus(
-        market_id=market_id,
-        active_traders=len(traders),
-        active_proposals=proposals,
-        total_trades=sum(t.get("trades", 0) for t in traders),
-        is_running=is_running,
-        process_id=process_id,
-        leading_proposal=leading_proposal,
-        leading_price=leading_price
-    )
+    return ORJSONResponse({
+        "market_id": market_id,
+        "active_traders": traders_count,
+        "active_proposals": proposals,
+        "total_trades": state.trades_by_market.get(market_id, 0),
+        "is_running": is_running,
+        "process_id": process_id,
+        "leading_proposal": leading_proposal,
+        "leading_price": leading_price
+    })
+
+async def terminate_process(process, timeout: float):
+    """Terminate process and wait for it, killing it if it outlives timeout seconds"""
+    process.terminate()
+    try:
+        await asyncio.wait_for(process.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
 
 @app.post("/api/swarm/stop/{market_id}")
 async def stop_swarm(market_id: int):
@@ -684,12 +974,11 @@ async def stop_swarm(market_id: int):
 
     try:
         process = state.swarm_processes[market_id]
-        process.terminate()
-        await asyncio.sleep(1)
-        if process.returncode is None:
-            process.kill()
+        await terminate_process(process, timeout=1.0)
         
-        del state.swarm_processes[market_id]
+        # The swarm task may already have dropped it once the process exited
+        state.swarm_processes.pop(market_id, None)
+        market_changed.set()
         
         await ws_manager.broadcast({
             "type": "swarm_stopped",
@@ -706,14 +995,13 @@ async def stop_swarm(market_id: int):
 async def get_traders(market_id: int):
     """Get list of active traders for a market"""
     traders = []
-    for trader_id, trader_data in state.active_traders.items():
-        if trader_data.get("market_id") == market_id:
-            traders.append(TraderInfo(
-                address=trader_data["address"],
-                balance=trader_data.get("balance", 0),
-                personality=trader_data.get("personality"),
-                trades_executed=trader_data.get("trades", 0)
-            ))
+    for trader_data in state.traders_by_market.get(market_id, {}).values():
+        traders.append(TraderInfo(
+            address=trader_data["address"],
+            balance=trader_data.get("balance", 0),
+            personality=trader_data.get("personality"),
+            trades_executed=trader_data.get("trades", 0)
+        ))
     return traders
 
 @app.get("/api/personalities")
@@ -724,19 +1012,25 @@ async def get_personalities():
     for p in INVISIBLE_CITIES:
         # Extract key info for frontend display
         personality = {
-            "name": p["name"],
-            "theme": p["theme"],
-            "description": p["description"],
-            "action_bias": p["action_bias"],
-            "risk_profile": p["risk_profile"],
-            "risk_tolerance": int((1 - p["bullish_threshold"]) * 100),  # Convert to 0-100 scale
-            "trading_philosophy": p["trading_philosophy"],
-            "typical_behavior": p["typical_behavior"]
+            "name": p.name,
+            "theme": p.theme,
+            "description": p.description,
+            "action_bias": p.action_bias,
+            "risk_profile": p.risk_profile,
+            "risk_tolerance": int((1 - p.bullish_threshold) * 100),  # Convert to 0-100 scale
+            "trading_philosophy": p.trading_philosophy,
+            "typical_behavior": p.typical_behavior
         }
         personalities_with_metadata.append(personality)
 
     return personalities_with_metadata
 
+# Clients ping every 30 s; one silent for this long is dropped
+WS_IDLE_TIMEOUT = 90.0
+
+# The frontend's ping, byte for byte (JSON.stringify({type: 'ping'}))
+PING_FRAME = '{"type":"ping"}'
+
 # WebSocket endpoint for real-time updates
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
@@ -745,135 +1039,192 @@ async def websocket_endpoint(websocket: WebSocket):
     
     try:
         # Send initial connection message
-        await websocket.send_text(json.dumps({
+        await ws_manager.send_personal(websocket, {
             "type": "connected",
             "message": "Connected to Zobeide WebSocket",
-            "timestamp": datetime.now().isoformat()
-        }))
+            "timestamp_ms": now_ms()
+        })
+        
+        # Give the new client the current market now rather than waiting for
+        # the next change or heartbeat; other clients are already up to date
+        try:
+            market_id = await read_latest_market_id()
+        except ValueError as e:
+            logger.error(f"Error reading latest market: {e}")
+            market_id = None
+        if market_id is not None:
+            await ws_manager.send_personal(websocket, market_update_message(market_id))
         
         while True:
-            # Keep connection alive and handle incoming messages
-            data = await websocket.receive_text()
+            # Keep connection alive and handle incoming messages; client
+            # messages are JSON text whichever format the server sends
+            data = await asyncio.wait_for(websocket.receive_text(), timeout=WS_IDLE_TIMEOUT)
+            
+            # Keepalive pings are most of the traffic; answer them without parsing
+            if data == PING_FRAME:
+                await ws_manager.send_personal(websocket, {
+                    "type": "pong",
+                    "timestamp_ms": now_ms()
+                })
+                continue
             
             # Handle subscription requests
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 if message.get("type") == "subscribe":
                     market_id = message.get("market_id")
+                    if isinstance(market_id, int):
+                        ws_manager.subscribe(websocket, market_id)
                     # Send initial market data
                     if market_id in state.active_markets:
-                        await websocket.send_text(json.dumps({
+                        await ws_manager.send_personal(websocket, {
                             "type": "market_data",
                             "data": state.active_markets[market_id],
-                            "timestamp": datetime.now().isoformat()
-                        }))
+                            "timestamp_ms": now_ms()
+                        })
+                elif message.get("type") == "hello":
+                    # Clients that can't set a subprotocol pick the frame format here
+                    encoding = ws_manager.set_encoding(websocket, message.get("encoding", "json"))
+                    await ws_manager.send_personal(websocket, {
+                        "type": "hello",
+                        "encoding": encoding,
+                        "timestamp_ms": now_ms()
+                    })
                 elif message.get("type") == "ping":
-                    await websocket.send_text(json.dumps({
+                    await ws_manager.send_personal(websocket, {
                         "type": "pong",
-                        "timestamp": datetime.now().isoformat()
-                    }))
-            except json.JSONDecodeError:
+                        "timestamp_ms": now_ms()
+                    })
+            except orjson.JSONDecodeError:
                 logger.warning(f"Invalid JSON received: {data}")
                 
     except WebSocketDisconnect:
         ws_manager.disconnect(websocket)
+    except asyncio.TimeoutError:
+        # No ping (or anything else) from the client; treat it as gone
+        logger.info("WebSocket idle timeout, closing")
+        ws_manager.disconnect(websocket)
+        await ws_manager._close(websocket)
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         ws_manager.disconnect(websocket)
 
+# broadcast_updates re-checks at least this often; without a file watcher this
+# is also how changes written by other processes (create_market.py) are seen
+MARKET_POLL_INTERVAL = 30.0 if awatch is not None else 2.0
+
+# An unchanged market_update is still re-sent this often
+MARKET_UPDATE_HEARTBEAT = 30.0
+
+async def watch_market_file():
+    """Wake broadcast_updates when any process rewrites latest_market.txt"""
+    LATEST_MARKET_FILE.parent.mkdir(exist_ok=True)
+    target = str(LATEST_MARKET_FILE)
+    async for _ in awatch(LATEST_MARKET_FILE.parent, watch_filter=lambda change, path: path == target):
+        market_changed.set()
+
+def market_update_message(market_id: int) -> dict:
+    """market_update event for market_id with its swarm status"""
+    process = state.swarm_processes.get(market_id)
+    market_update = {
+        "type": "market_update",
+        "market_id": market_id,
+        "timestamp_ms": now_ms()
+    }
+    
+    # Check if swarm is running
+    if process is not None:
+        market_update["swarm_status"] = {
+            "is_running": True,
+            "process_id": str(process.pid)
+        }
+    else:
+        market_update["swarm_status"] = {
+            "is_running": False
+        }
+    return market_update
+
 # Background task to broadcast updates
 async def broadcast_updates():
-    """Broadcast market and swarm updates to all WebSocket clients"""
+    """Broadcast market and swarm updates to all WebSocket clients when they change"""
+    last_sent = 0.0
     while True:
+        try:
+            await asyncio.wait_for(market_changed.wait(), timeout=MARKET_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        market_changed.clear()
+
         try:
             # Read the latest market from file
-            market_file = Path(__file__).parent.parent.parent / "backend" / "src" / "core" / "latest_market.txt"
-            if market_file.exists() and ws_manager.active_connections:
-                with open(market_file, "r") as f:
-                    market_id = int(f.read().strip())
-                    
-                    # Broadcast market status
-                    market_update = {
-                        "type": "market_update",
-                        "market_id": market_id,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    
-                    # Check if swarm is running
-                    if market_id in state.swarm_processes:
-                        market_update["swarm_status"] = {
-                            "is_running": True,
-                            "process_id": str(state.swarm_processes[market_id].pid) if state.swarm_processes[market_id] else None
-                        }
-                    else:
-                        market_update["swarm_status"] = {
-                            "is_running": False
-                        }
-                    
-                    await ws_manager.broadcast(market_update)
-                    
+            market_id = await read_latest_market_id() if ws_manager.active_connections else None
+            if market_id is not None:
+                process = state.swarm_processes.get(market_id)
+                key = (market_id, process.pid if process else None)
+                now = time.monotonic()
+                if key == state.last_market_update and now - last_sent < MARKET_UPDATE_HEARTBEAT:
+                    continue
+
+                # Broadcast market status
+                ws_manager.broadcast_message_nowait(market_update_message(market_id), snapshot=True)
+                state.last_market_update = key
+                last_sent = now
+                
         except Exception as e:
             logger.error(f"Error in broadcast_updates: {e}")
-        
-        # Broadcast every 2 seconds
-        await asyncio.sleep(2)
 
-# Global background task
+# Global background tasks
 broadcast_task = None
+watch_task = None
 
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
     """Initialize application state on startup"""
-    global broadcast_task
+    global broadcast_task, watch_task
     logger.info("Zobeide API starting up...")
     
-    # Start the broadcast task
+    # Start the broadcast task, and the file watcher that wakes it if available
     broadcast_task = asyncio.create_task(broadcast_updates())
+    if awatch is not None:
+        watch_task = asyncio.create_task(watch_market_file())
     
     # Load any existing market data
-    market_file = Path(__file__).parent.parent.parent / "backend" / "src" / "core" / "latest_market.txt"
-    if market_file.exists():
-        with open(market_file, "r") as f:
-            try:
-                market_id = int(f.read().strip())
-                # Could load market details from blockchain here
-                state.active_markets[market_id] = {
-                    "title": "Recovered Market",
-                    "deadline": 0,
-                    "is_graduated": False,
-                    "recovered": True
-                }
-                logger.info(f"Recovered market ID: {market_id}")
-            except Exception as e:
-                logger.warning(f"Could not recover market: {e}")
+    try:
+        market_id = await read_latest_market_id()
+        if market_id is not None:
+            # Could load market details from blockchain here
+            state.active_markets[market_id] = {
+                "title": "Recovered Market",
+                "deadline": 0,
+                "is_graduated": False,
+                "recovered": True
+            }
+            logger.info(f"Recovered market ID: {market_id}")
+    except Exception as e:
+        logger.warning(f"Could not recover market: {e}")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up on shutdown"""
-    global broadcast_task
+    global broadcast_task, watch_task
     logger.info("Zobeide API shutting down...")
     
-    # Cancel broadcast task
+    # Cancel background tasks
     if broadcast_task:
         broadcast_task.cancel()
+    if watch_task:
+        watch_task.cancel()
     
-    # Terminate all running swarm processes
-    for market_id, process in state.swarm_processes.items():
-        try:
-            process.terminate()
-            await asyncio.sleep(0.5)
-            if process.returncode is None:
-                process.kill()
-        except:
-            pass
+    # Terminate all running swarm processes together
+    await asyncio.gather(
+        *(terminate_process(process, timeout=0.5) for process in list(state.swarm_processes.values())),
+        return_exceptions=True
+    )
     
-    # Close WebSocket connections
-    for connection in ws_manager.active_connections:
-        try:
-            await connection.close()
-        except:
-            pass
+    # Close WebSocket connections together, bounded so a stuck peer can't
+    # hold up the server's graceful-shutdown window
+    await ws_manager.close_all(timeout=2.0)
 
 if __name__ == "__main__":
     import uvicorn
@@ -882,12 +1233,27 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
     
-    logger.info(f"Starting API server on {host}:{port}")
+    # Name the fast loop and HTTP parser explicitly (both come with
+    # uvicorn[standard]) so a missing one shows up in the startup log
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    
+    logger.info(f"Starting API server on {host}:{port} (loop={loop}, http={http})")
     
     uvicorn.run(
         "server:app",
         host=host,
         port=port,
+        loop=loop,
+        http=http,
         reload=False,  # Disabled to avoid multiprocessing import issues with cosmpy/protobuf
         log_level="info"
     )
\ No newline at end of file